@@ -0,0 +1,36 @@
+"""Add indexes on users.role_id and users.created_at
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Index the users columns used by foreign-key actions and listing.
+    
+    Creates:
+    - ix_users_role_id: role deletion sets role_id to NULL on referencing users
+    - ix_users_created_at: GET /users pages by created_at DESC
+    """
+    op.create_index(op.f('ix_users_role_id'), 'users', ['role_id'], unique=False)
+    op.create_index(op.f('ix_users_created_at'), 'users', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """
+    Drop indexes created in upgrade.
+    """
+    op.drop_index(op.f('ix_users_created_at'), table_name='users')
+    op.drop_index(op.f('ix_users_role_id'), table_name='users')
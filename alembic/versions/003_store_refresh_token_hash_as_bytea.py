@@ -0,0 +1,48 @@
+"""Store refresh token hashes as raw SHA-256 bytes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Convert refresh_tokens.token_hash from hex text to BYTEA.
+    
+    Hex SHA-256 values are decoded in place; rows in any other format
+    cannot be matched by the new lookup and are removed (their owners
+    log in again).
+    """
+    op.execute("DELETE FROM refresh_tokens WHERE token_hash !~ '^[0-9a-f]{64}$'")
+    op.alter_column(
+        'refresh_tokens',
+        'token_hash',
+        type_=sa.LargeBinary(length=32),
+        existing_nullable=False,
+        postgresql_using="decode(token_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """
+    Convert refresh_tokens.token_hash back to hex text.
+    """
+    op.alter_column(
+        'refresh_tokens',
+        'token_hash',
+        type_=sa.String(length=255),
+        existing_nullable=False,
+        postgresql_using="encode(token_hash, 'hex')",
+    )
@@ -5,19 +5,29 @@ RESTful endpoints for user registration, login, token refresh, and password mana
 Implements OAuth2 password flow with JWT tokens.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, Dict
+import asyncio
+import hashlib
 import logging
 
 from app.schemas.auth import (
     UserCreate, UserResponse, Token, RefreshTokenRequest,
-    ChangePasswordRequest, ForgotPasswordRequest, ResetPasswordRequest
+    ChangePasswordRequest, ForgotPasswordRequest, ResetPasswordRequest,
+    UserDetailResponse, EmptyResponse
 )
 from app.services.auth_service import AuthService
 from app.core.database import get_db
-from app.dependencies import get_current_user, get_current_active_user
+from app.core.redis_client import redis_client
+from app.core.token_cache import token_cache
+from app.core.metrics import LOGIN_SUCCESS, LOGIN_FAILURE, LOGIN_INVALID, LOGIN_INACTIVE
+from app.dependencies import (
+    oauth2_scheme, get_current_active_user, get_current_active_db_user,
+    json_body, json_body_openapi
+)
 from gravity_common.models import ApiResponse
 from gravity_common.exceptions import (
     GravityException, UnauthorizedException, NotFoundException,
@@ -28,13 +38,26 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
+# Per-email throttle for password reset requests
+FORGOT_PASSWORD_MAX_REQUESTS = 3
+FORGOT_PASSWORD_WINDOW_SECONDS = 300
+
+# Refreshes in flight, keyed by refresh token digest. Clients often fire several
+# requests at once when the access token expires; duplicates await the first
+# request's result instead of rotating the same token again.
+_REFRESH_INFLIGHT: Dict[bytes, "asyncio.Future[Token]"] = {}
+
+# Hot routes (/login, /refresh, /me) return pre-built ORJSONResponse objects with
+# response_model=None, so FastAPI skips re-validating the payload against the
+# generic model. The model is still declared under ``responses`` for OpenAPI.
+# Other routes keep response_model since docs matter more than throughput there.
 
 
 @router.post(
     "/register",
-    response_model=ApiResponse[UserResponse],
+    response_model=UserDetailResponse,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(UserCreate),
     summary="Register new user",
     description="Create a new user account with email and password",
     responses={
@@ -44,9 +67,9 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
     }
 )
 async def register(
-    user_data: UserCreate,
+    user_data: Annotated[UserCreate, Depends(json_body(UserCreate))],
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[UserResponse]:
+) -> UserDetailResponse:
     """
     Register a new user.
     
@@ -57,7 +80,7 @@ async def register(
     Returns:
         ApiResponse with created user data
     """
-    logger.info(f"Registration request for email: {user_data.email}")
+    logger.debug("Registration request for email: %s", user_data.email)
     
     try:
         auth_service = AuthService(db)
@@ -75,29 +98,22 @@ async def register(
             status_code=status.HTTP_409_CONFLICT,
             detail=e.message
         )
-    
-    except Exception as e:
-        logger.exception(f"Unexpected error during registration: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
 
 
 @router.post(
     "/login",
-    response_model=Token,
+    response_model=None,
     summary="Login user",
     description="Authenticate user and return access & refresh tokens",
     responses={
-        200: {"description": "Login successful"},
+        200: {"model": Token, "description": "Login successful"},
         401: {"description": "Invalid credentials"}
     }
 )
 async def login(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: AsyncSession = Depends(get_db)
-) -> Token:
+) -> ORJSONResponse:
     """
     Login user with email and password.
     
@@ -110,7 +126,7 @@ async def login(
     Returns:
         Access and refresh tokens
     """
-    logger.info(f"Login request for email: {form_data.username}")
+    logger.debug("Login request for email: %s", form_data.username)
     
     try:
         auth_service = AuthService(db)
@@ -123,39 +139,39 @@ async def login(
         
         # Create tokens
         tokens = await auth_service.create_tokens(user)
+        LOGIN_SUCCESS.inc()
         
-        return tokens
+        return ORJSONResponse(tokens.model_dump())
     
     except UnauthorizedException as e:
         logger.warning(f"Login failed: {e.message}")
+        LOGIN_FAILURE.inc()
+        if (e.details or {}).get("reason") == "account_inactive":
+            LOGIN_INACTIVE.inc()
+        else:
+            LOGIN_INVALID.inc()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=e.message,
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    except Exception as e:
-        logger.exception(f"Unexpected error during login: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
 
 
 @router.post(
     "/refresh",
-    response_model=Token,
+    response_model=None,
+    openapi_extra=json_body_openapi(RefreshTokenRequest),
     summary="Refresh access token",
     description="Get new access token using refresh token",
     responses={
-        200: {"description": "Token refreshed successfully"},
+        200: {"model": Token, "description": "Token refreshed successfully"},
         401: {"description": "Invalid refresh token"}
     }
 )
 async def refresh_token(
-    refresh_data: RefreshTokenRequest,
+    refresh_data: Annotated[RefreshTokenRequest, Depends(json_body(RefreshTokenRequest))],
     db: AsyncSession = Depends(get_db)
-) -> Token:
+) -> ORJSONResponse:
     """
     Refresh access token.
     
@@ -168,11 +184,24 @@ async def refresh_token(
     """
     logger.debug("Token refresh request")
     
+    key = hashlib.sha256(refresh_data.refresh_token.encode()).digest()
+    
     try:
-        auth_service = AuthService(db)
-        new_tokens = await auth_service.refresh_access_token(refresh_data.refresh_token)
+        while True:
+            inflight = _REFRESH_INFLIGHT.get(key)
+            if inflight is None:
+                new_tokens = await _refresh_single_flight(key, refresh_data.refresh_token, db)
+                break
+            try:
+                new_tokens = await asyncio.shield(inflight)
+                break
+            except asyncio.CancelledError:
+                # The first request was cancelled (its client went away); this
+                # request is still live, so it takes over the refresh itself
+                if not inflight.cancelled():
+                    raise
         
-        return new_tokens
+        return ORJSONResponse(new_tokens.model_dump())
     
     except UnauthorizedException as e:
         logger.warning(f"Token refresh failed: {e.message}")
@@ -181,28 +210,56 @@ async def refresh_token(
             detail=e.message,
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+async def _refresh_single_flight(key: bytes, refresh_token: str, db: AsyncSession) -> Token:
+    """
+    Refresh tokens and publish the outcome to concurrent duplicate requests.
+    
+    If this request is cancelled, the shared future is cancelled too and
+    waiting duplicates retry the refresh on their own.
     
+    Args:
+        key: Digest of the refresh token
+        refresh_token: Refresh token
+        db: Database session
+        
+    Returns:
+        New access and refresh tokens
+    """
+    future = asyncio.get_running_loop().create_future()
+    _REFRESH_INFLIGHT[key] = future
+    try:
+        auth_service = AuthService(db)
+        new_tokens = await auth_service.refresh_access_token(refresh_token)
+        future.set_result(new_tokens)
+        return new_tokens
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
     except Exception as e:
-        logger.exception(f"Unexpected error refreshing token: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+        future.set_exception(e)
+        # Mark retrieved so asyncio doesn't warn when no duplicate was waiting
+        future.exception()
+        raise
+    finally:
+        del _REFRESH_INFLIGHT[key]
 
 
 @router.post(
     "/logout",
-    response_model=ApiResponse[None],
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="Logout user",
     description="Logout user by blacklisting access token",
     responses={
-        200: {"description": "Logout successful"}
+        204: {"description": "Logout successful"}
     }
 )
 async def logout(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[None]:
+) -> Response:
     """
     Logout user.
     
@@ -213,72 +270,68 @@ async def logout(
         db: Database session
         
     Returns:
-        Success message
+        Empty 204 response
     """
     logger.debug("Logout request")
     
-    try:
-        auth_service = AuthService(db)
-        await auth_service.logout(token)
-        
-        return ApiResponse(
-            success=True,
-            message="Logged out successfully"
-        )
+    auth_service = AuthService(db)
+    await auth_service.logout(token)
+    await token_cache.delete(token)
     
-    except Exception as e:
-        logger.exception(f"Error during logout: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get(
     "/me",
-    response_model=ApiResponse[UserResponse],
+    response_model=None,
     summary="Get current user",
     description="Get currently authenticated user information",
     responses={
-        200: {"description": "User information retrieved"},
+        200: {"model": UserDetailResponse, "description": "User information retrieved"},
         401: {"description": "Not authenticated"}
     }
 )
 async def get_current_user_info(
     current_user: Annotated[UserResponse, Depends(get_current_active_user)]
-) -> ApiResponse[UserResponse]:
+) -> ORJSONResponse:
     """
     Get current user information.
     
+    Served from the access token's claims, i.e. the profile as of login.
+    Admin changes to the user revoke their access tokens, so a changed or
+    deleted user gets 401 here and fresh claims after refreshing.
+    
     Args:
         current_user: Current authenticated user
         
     Returns:
         Current user data
     """
-    return ApiResponse(
-        success=True,
-        data=current_user,
-        message="User information retrieved successfully"
-    )
+    return ORJSONResponse({
+        "success": True,
+        "data": current_user.model_dump(),
+        "message": "User information retrieved successfully",
+    })
 
 
 @router.post(
     "/change-password",
-    response_model=ApiResponse[None],
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+    openapi_extra=json_body_openapi(ChangePasswordRequest),
     summary="Change password",
     description="Change password for authenticated user",
     responses={
-        200: {"description": "Password changed successfully"},
+        204: {"description": "Password changed successfully"},
         400: {"description": "Invalid old password"},
         401: {"description": "Not authenticated"}
     }
 )
 async def change_password(
-    password_data: ChangePasswordRequest,
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)],
+    password_data: Annotated[ChangePasswordRequest, Depends(json_body(ChangePasswordRequest))],
+    current_user: Annotated[UserResponse, Depends(get_current_active_db_user)],
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[None]:
+) -> Response:
     """
     Change user password.
     
@@ -288,18 +341,15 @@ async def change_password(
         db: Database session
         
     Returns:
-        Success message
+        Empty 204 response
     """
-    logger.info(f"Password change request for user: {current_user.email}")
+    logger.debug("Password change request for user: %s", current_user.email)
     
     try:
         auth_service = AuthService(db)
         await auth_service.change_password(current_user.id, password_data)
         
-        return ApiResponse(
-            success=True,
-            message="Password changed successfully"
-        )
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
     
     except BadRequestException as e:
         logger.warning(f"Password change failed: {e.message}")
@@ -307,18 +357,12 @@ async def change_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message
         )
-    
-    except Exception as e:
-        logger.exception(f"Error changing password: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
 
 
 @router.post(
     "/forgot-password",
     response_model=ApiResponse[dict],
+    openapi_extra=json_body_openapi(ForgotPasswordRequest),
     summary="Request password reset",
     description="Request password reset token (sent via email)",
     responses={
@@ -327,7 +371,7 @@ async def change_password(
     }
 )
 async def forgot_password(
-    request_data: ForgotPasswordRequest,
+    request_data: Annotated[ForgotPasswordRequest, Depends(json_body(ForgotPasswordRequest))],
     db: AsyncSession = Depends(get_db)
 ) -> ApiResponse[dict]:
     """
@@ -343,7 +387,23 @@ async def forgot_password(
     Returns:
         Success message with reset token (dev only)
     """
-    logger.info(f"Password reset requested for: {request_data.email}")
+    logger.debug("Password reset requested for: %s", request_data.email)
+    
+    # Throttle per email; over-limit requests get the same response as unknown emails
+    email_hash = hashlib.sha256(request_data.email.lower().encode()).hexdigest()[:16]
+    throttle_key = f"fpw:{email_hash}"
+    try:
+        attempts = await redis_client.incr_with_expire(throttle_key, FORGOT_PASSWORD_WINDOW_SECONDS)
+    except Exception as e:
+        # Fail open: an unavailable throttle must not block password resets
+        logger.warning("Password reset throttle unavailable: %s", e)
+        attempts = 0
+    if attempts > FORGOT_PASSWORD_MAX_REQUESTS:
+        logger.warning("Password reset throttled for email hash: %s", email_hash)
+        return ApiResponse(
+            success=True,
+            message="If email exists, reset instructions have been sent"
+        )
     
     try:
         auth_service = AuthService(db)
@@ -364,18 +424,12 @@ async def forgot_password(
             success=True,
             message="If email exists, reset instructions have been sent"
         )
-    
-    except Exception as e:
-        logger.exception(f"Error requesting password reset: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
 
 
 @router.post(
     "/reset-password",
-    response_model=ApiResponse[None],
+    response_model=EmptyResponse,
+    openapi_extra=json_body_openapi(ResetPasswordRequest),
     summary="Reset password",
     description="Reset password using reset token",
     responses={
@@ -384,9 +438,9 @@ async def forgot_password(
     }
 )
 async def reset_password(
-    reset_data: ResetPasswordRequest,
+    reset_data: Annotated[ResetPasswordRequest, Depends(json_body(ResetPasswordRequest))],
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[None]:
+) -> EmptyResponse:
     """
     Reset password with reset token.
     
@@ -397,7 +451,7 @@ async def reset_password(
     Returns:
         Success message
     """
-    logger.info("Password reset request")
+    logger.debug("Password reset request")
     
     try:
         auth_service = AuthService(db)
@@ -414,10 +468,3 @@ async def reset_password(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=e.message
         )
-    
-    except Exception as e:
-        logger.exception(f"Error resetting password: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
@@ -0,0 +1,58 @@
+"""
+Service error translation for API endpoints.
+
+Maps service-layer exceptions to HTTP errors in one place instead of
+per-handler try/except blocks. Unexpected errors fall through to the
+application-level exception handler.
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, TypeVar
+import logging
+
+from fastapi import HTTPException, status
+from app.core.token_blacklist import TokenRevocationError
+from gravity_common.exceptions import BadRequestException, ConflictException, NotFoundException
+
+logger = logging.getLogger(__name__)
+
+ReturnT = TypeVar("ReturnT")
+
+
+def handle_service_errors(
+    func: Callable[..., Awaitable[ReturnT]]
+) -> Callable[..., Awaitable[ReturnT]]:
+    """
+    Translate service exceptions raised by an endpoint into HTTP errors.
+    
+    The wrapper keeps the endpoint signature, so FastAPI resolves the same
+    parameters and dependencies.
+    
+    Args:
+        func: Endpoint coroutine function
+    
+    Returns:
+        Wrapped endpoint
+    """
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> ReturnT:
+        try:
+            return await func(*args, **kwargs)
+        except NotFoundException as e:
+            logger.warning("%s failed: %s", func.__name__, e.message)
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=e.message)
+        except ConflictException as e:
+            logger.warning("%s failed: %s", func.__name__, e.message)
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=e.message)
+        except BadRequestException as e:
+            logger.warning("%s failed: %s", func.__name__, e.message)
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+        except TokenRevocationError as e:
+            # The change itself is committed; report that old tokens still work
+            logger.error("%s failed: %s", func.__name__, e)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Change saved, but {e}"
+            )
+    
+    return wrapper
@@ -0,0 +1,69 @@
+"""
+HTTP conditional request helpers.
+
+Builds ETag-aware responses so clients and reverse proxies can revalidate
+cached GET responses and receive 304 Not Modified instead of the body.
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def content_etag(content: bytes) -> str:
+    """
+    Build a weak ETag from a response body.
+    
+    Args:
+        content: Serialized response body
+    
+    Returns:
+        Weak ETag header value
+    """
+    return f'W/"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match covers the given ETag.
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+    
+    Returns:
+        True if the client already holds the current representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def cached_json_response(
+    request: Request,
+    etag: str,
+    cache_control: str,
+    content: Optional[bytes] = None,
+) -> Optional[Response]:
+    """
+    Build a 304 or JSON response carrying ETag and Cache-Control headers.
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        cache_control: Cache-Control header value
+        content: Serialized body; when None only a 304 can be returned
+    
+    Returns:
+        304 response if the client is up to date, the JSON response if content
+        is given, otherwise None
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if content is None:
+        return None
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -4,84 +4,114 @@ Role management API endpoints.
 Admin-only endpoints for managing roles and permissions.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Request, Response, status
 from typing import Annotated, List
+import asyncio
 import logging
 
-from app.schemas.auth import RoleCreate, RoleUpdate, RoleResponse, AssignRoleRequest
+from app.schemas.auth import (
+    RoleCreate, AssignRoleRequest, BulkAssignRoleRequest, BulkAssignRoleResponse,
+    RoleListResponse, RoleDetailResponse, RoleResponse, EmptyResponse, BulkAssignResponse
+)
+from app.core.database import read_db_manager
 from app.services.role_service import RoleService
-from app.core.database import get_db
-from app.dependencies import get_current_superuser
-from gravity_common.models import ApiResponse
-from gravity_common.exceptions import NotFoundException, ConflictException
+from app.services.role_cache import role_cache, serialize_roles
+from app.core.token_blacklist import token_blacklist
+from app.core.token_cache import token_cache
+from app.api.v1.errors import handle_service_errors
+from app.api.v1.http_cache import cached_json_response
+from app.dependencies import (
+    get_current_superuser, get_role_service,
+    json_body, json_body_openapi
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Response envelopes are built as described in app.schemas.auth
+
+# Role list responses may be reused briefly by clients and proxies; the ETag
+# follows the role cache version so revalidation needs no database access
+ROLES_CACHE_CONTROL = "private, max-age=30"
+
+
+async def _load_roles() -> List[RoleResponse]:
+    """
+    Query the role list in a read-only session.
+    
+    The session is opened here rather than injected, so requests answered
+    from the role cache or with 304 never check out a connection.
+    
+    Returns:
+        List of all roles
+    """
+    async with read_db_manager.session(readonly=True) as session:
+        return await RoleService(session).list_roles()
+
 
 @router.get(
     "/roles",
-    response_model=ApiResponse[List[RoleResponse]],
+    response_model=None,
     summary="List all roles",
     description="Get list of all roles",
     responses={
-        200: {"description": "Roles retrieved successfully"}
+        200: {"model": RoleListResponse, "description": "Roles retrieved successfully"},
+        304: {"description": "Roles not modified since the given ETag"}
     }
 )
-async def list_roles(
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[List[RoleResponse]]:
+@handle_service_errors
+async def list_roles(request: Request) -> Response:
     """
     List all roles.
     
-    Available to all authenticated users.
+    Available to all authenticated users. If Redis is unavailable the roles
+    are read from the database and returned without an ETag.
     
     Args:
-        db: Database session
+        request: Incoming request, for If-None-Match
         
     Returns:
-        List of roles
+        List of roles, or 304 if the client's copy is current
     """
     logger.debug("List roles request")
     
     try:
-        role_service = RoleService(db)
-        roles = await role_service.list_roles()
-        
-        return ApiResponse(
-            success=True,
-            data=roles,
-            message="Roles retrieved successfully"
-        )
-    
+        version = await role_cache.current_version()
     except Exception as e:
-        logger.exception(f"Error listing roles: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+        logger.warning("Role cache unavailable, listing roles from the database: %s", e)
+        return Response(content=serialize_roles(await _load_roles()), media_type="application/json")
+    
+    etag = f'W/"roles-v{version}"'
+    not_modified = cached_json_response(request, etag, ROLES_CACHE_CONTROL)
+    if not_modified is not None:
+        return not_modified
+    
+    # Served from the role cache; only a double miss queries the database
+    payload = await role_cache.get_payload(_load_roles)
+    return cached_json_response(request, etag, ROLES_CACHE_CONTROL, payload)
 
 
 @router.post(
     "/roles",
-    response_model=ApiResponse[RoleResponse],
+    response_model=None,
     status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(RoleCreate),
     summary="Create new role",
     description="Create a new role with permissions (admin only)",
     responses={
-        201: {"description": "Role created successfully"},
+        201: {"model": RoleDetailResponse, "description": "Role created successfully"},
         409: {"description": "Role already exists"},
         401: {"description": "Not authenticated"},
         403: {"description": "Not authorized (admin only)"}
     }
 )
+@handle_service_errors
 async def create_role(
-    role_data: RoleCreate,
+    role_data: Annotated[RoleCreate, Depends(json_body(RoleCreate))],
     current_user: Annotated[object, Depends(get_current_superuser)],
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[RoleResponse]:
+    role_service: RoleService = Depends(get_role_service)
+) -> Response:
     """
     Create a new role.
     
@@ -90,56 +120,49 @@ async def create_role(
     Args:
         role_data: Role creation data
         current_user: Current authenticated superuser
-        db: Database session
+        role_service: Role service
         
     Returns:
         Created role data
     """
-    logger.info(f"Create role request: {role_data.name}")
+    logger.debug("Create role request: %s", role_data.name)
     
-    try:
-        role_service = RoleService(db)
-        role = await role_service.create_role(role_data)
-        
-        return ApiResponse(
-            success=True,
-            data=role,
-            message="Role created successfully"
-        )
-    
-    except ConflictException as e:
-        logger.warning(f"Role creation failed: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=e.message
-        )
+    role = await role_service.create_role(role_data)
+    await role_cache.invalidate()
     
-    except Exception as e:
-        logger.exception(f"Error creating role: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    api_response = RoleDetailResponse.model_construct(
+        success=True,
+        data=role,
+        message="Role created successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        status_code=status.HTTP_201_CREATED,
+        media_type="application/json",
+    )
 
 
 @router.put(
     "/users/{user_id}/role",
-    response_model=ApiResponse[object],
+    response_model=None,
+    openapi_extra=json_body_openapi(AssignRoleRequest),
     summary="Assign role to user",
     description="Assign a role to a user (admin only)",
     responses={
-        200: {"description": "Role assigned successfully"},
+        200: {"model": EmptyResponse, "description": "Role assigned successfully"},
         404: {"description": "User or role not found"},
         401: {"description": "Not authenticated"},
-        403: {"description": "Not authorized (admin only)"}
+        403: {"description": "Not authorized (admin only)"},
+        503: {"description": "Change saved, but existing access tokens could not be revoked"}
     }
 )
+@handle_service_errors
 async def assign_role_to_user(
     user_id: int,
-    assign_data: AssignRoleRequest,
+    assign_data: Annotated[AssignRoleRequest, Depends(json_body(AssignRoleRequest))],
     current_user: Annotated[object, Depends(get_current_superuser)],
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[object]:
+    role_service: RoleService = Depends(get_role_service)
+) -> Response:
     """
     Assign role to user.
     
@@ -149,32 +172,76 @@ async def assign_role_to_user(
         user_id: User ID
         assign_data: Role assignment data
         current_user: Current authenticated superuser
-        db: Database session
+        role_service: Role service
         
     Returns:
         Success message
     """
-    logger.info(f"Assign role request - user: {user_id}, role: {assign_data.role_id}")
+    logger.debug("Assign role request - user: %s, role: %s", user_id, assign_data.role_id)
     
-    try:
-        role_service = RoleService(db)
-        await role_service.assign_role_to_user(user_id, assign_data.role_id)
+    await role_service.assign_role_to_user(user_id, assign_data.role_id)
+    await asyncio.gather(
+        token_cache.invalidate_user(user_id),
+        token_blacklist.revoke_user(user_id),
+    )
+    
+    api_response = EmptyResponse.model_construct(
+        success=True,
+        message="Role assigned successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        media_type="application/json",
+    )
+
+
+@router.post(
+    "/users/roles/bulk-assign",
+    response_model=None,
+    openapi_extra=json_body_openapi(BulkAssignRoleRequest),
+    summary="Assign roles to many users",
+    description="Assign roles to a batch of users in one transaction (admin only)",
+    responses={
+        200: {"model": BulkAssignResponse, "description": "Roles assigned successfully"},
+        404: {"description": "User or role not found"},
+        401: {"description": "Not authenticated"},
+        403: {"description": "Not authorized (admin only)"},
+        503: {"description": "Change saved, but existing access tokens could not be revoked"}
+    }
+)
+@handle_service_errors
+async def bulk_assign_roles(
+    bulk_data: Annotated[BulkAssignRoleRequest, Depends(json_body(BulkAssignRoleRequest))],
+    current_user: Annotated[object, Depends(get_current_superuser)],
+    role_service: RoleService = Depends(get_role_service)
+) -> Response:
+    """
+    Assign roles to many users at once.
+    
+    Requires superuser privileges. All assignments succeed or none do.
+    
+    Args:
+        bulk_data: User and role ID pairs
+        current_user: Current authenticated superuser
+        role_service: Role service
         
-        return ApiResponse(
-            success=True,
-            message="Role assigned successfully"
-        )
-    
-    except NotFoundException as e:
-        logger.warning(f"Role assignment failed: {e.message}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=e.message
-        )
+    Returns:
+        Number of users updated
+    """
+    logger.debug("Bulk assign role request - %s assignments", len(bulk_data.assignments))
     
-    except Exception as e:
-        logger.exception(f"Error assigning role: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    updated = await role_service.bulk_assign_roles(bulk_data.assignments)
+    await asyncio.gather(
+        *(token_cache.invalidate_user(user_id) for user_id in updated),
+        *(token_blacklist.revoke_user(user_id) for user_id in updated),
+    )
+    
+    api_response = BulkAssignResponse.model_construct(
+        success=True,
+        data=BulkAssignRoleResponse(updated=len(updated)),
+        message="Roles assigned successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        media_type="application/json",
+    )
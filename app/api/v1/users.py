@@ -4,40 +4,54 @@ User management API endpoints.
 Admin-only endpoints for managing users.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from typing import Annotated, List
+import asyncio
 import logging
 
-from app.schemas.auth import UserResponse, UserUpdate
+from app.schemas.auth import (
+    UserResponse, UserUpdate, UserPageResponse, UserDetailResponse, EmptyResponse
+)
 from app.services.user_service import UserService
-from app.core.database import get_db
-from app.dependencies import get_current_superuser
-from gravity_common.models import ApiResponse, PaginatedResponse, PaginationParams
-from gravity_common.exceptions import NotFoundException
+from app.core.token_blacklist import token_blacklist
+from app.core.token_cache import token_cache
+from app.api.v1.errors import handle_service_errors
+from app.api.v1.http_cache import cached_json_response, content_etag
+from app.dependencies import (
+    get_current_superuser, get_user_service, get_read_user_service,
+    json_body, json_body_openapi
+)
+from gravity_common.models import PaginationParams
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Response envelopes are built as described in app.schemas.auth
+
+# User details must reflect admin changes at once, so clients always revalidate;
+# a matching ETag still saves the response body
+USER_CACHE_CONTROL = "private, no-cache"
+
 
 @router.get(
     "/users",
-    response_model=ApiResponse[PaginatedResponse[UserResponse]],
+    response_model=None,
     summary="List all users",
     description="Get paginated list of all users (admin only)",
     responses={
-        200: {"description": "Users retrieved successfully"},
+        200: {"model": UserPageResponse, "description": "Users retrieved successfully"},
         401: {"description": "Not authenticated"},
         403: {"description": "Not authorized (admin only)"}
     }
 )
+@handle_service_errors
 async def list_users(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     current_user: Annotated[UserResponse, Depends(get_current_superuser)] = None,
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[PaginatedResponse[UserResponse]]:
+    user_service: UserService = Depends(get_read_user_service)
+) -> Response:
     """
     List all users with pagination.
     
@@ -47,108 +61,96 @@ async def list_users(
         page: Page number
         page_size: Items per page
         current_user: Current authenticated superuser
-        db: Database session
+        user_service: User service
         
     Returns:
         Paginated list of users
     """
-    logger.debug(f"List users request - page: {page}, page_size: {page_size}")
+    logger.debug("List users request - page: %s, page_size: %s", page, page_size)
     
-    try:
-        user_service = UserService(db)
-        pagination = PaginationParams(page=page, page_size=page_size)
-        
-        users_page = await user_service.list_users(pagination)
-        
-        return ApiResponse(
-            success=True,
-            data=users_page,
-            message="Users retrieved successfully"
-        )
+    pagination = PaginationParams(page=page, page_size=page_size)
     
-    except Exception as e:
-        logger.exception(f"Error listing users: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    users_page = await user_service.list_users(pagination)
+    
+    api_response = UserPageResponse.model_construct(
+        success=True,
+        data=users_page,
+        message="Users retrieved successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        media_type="application/json",
+    )
 
 
 @router.get(
     "/users/{user_id}",
-    response_model=ApiResponse[UserResponse],
+    response_model=None,
     summary="Get user by ID",
     description="Get specific user by ID (admin only)",
     responses={
-        200: {"description": "User retrieved successfully"},
+        200: {"model": UserDetailResponse, "description": "User retrieved successfully"},
+        304: {"description": "User not modified since the given ETag"},
         404: {"description": "User not found"},
         401: {"description": "Not authenticated"},
         403: {"description": "Not authorized (admin only)"}
     }
 )
+@handle_service_errors
 async def get_user(
+    request: Request,
     user_id: int,
     current_user: Annotated[UserResponse, Depends(get_current_superuser)],
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[UserResponse]:
+    user_service: UserService = Depends(get_read_user_service)
+) -> Response:
     """
     Get user by ID.
     
     Requires superuser privileges.
     
     Args:
+        request: Incoming request, for If-None-Match
         user_id: User ID
         current_user: Current authenticated superuser
-        db: Database session
+        user_service: User service
         
     Returns:
-        User data
+        User data, or 304 if the client's copy is current
     """
-    logger.debug(f"Get user request for ID: {user_id}")
-    
-    try:
-        user_service = UserService(db)
-        user = await user_service.get_user_by_id(user_id)
-        
-        return ApiResponse(
-            success=True,
-            data=user,
-            message="User retrieved successfully"
-        )
+    logger.debug("Get user request for ID: %s", user_id)
     
-    except NotFoundException as e:
-        logger.warning(f"User not found: {user_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=e.message
-        )
+    user = await user_service.get_user_by_id(user_id)
     
-    except Exception as e:
-        logger.exception(f"Error getting user: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    api_response = UserDetailResponse.model_construct(
+        success=True,
+        data=user,
+        message="User retrieved successfully"
+    )
+    content = api_response.model_dump_json().encode()
+    return cached_json_response(request, content_etag(content), USER_CACHE_CONTROL, content)
 
 
 @router.put(
     "/users/{user_id}",
-    response_model=ApiResponse[UserResponse],
+    response_model=None,
+    openapi_extra=json_body_openapi(UserUpdate),
     summary="Update user",
     description="Update user information (admin only)",
     responses={
-        200: {"description": "User updated successfully"},
+        200: {"model": UserDetailResponse, "description": "User updated successfully"},
         404: {"description": "User not found"},
         401: {"description": "Not authenticated"},
-        403: {"description": "Not authorized (admin only)"}
+        403: {"description": "Not authorized (admin only)"},
+        503: {"description": "Change saved, but existing access tokens could not be revoked"}
     }
 )
+@handle_service_errors
 async def update_user(
     user_id: int,
-    user_data: UserUpdate,
+    user_data: Annotated[UserUpdate, Depends(json_body(UserUpdate))],
     current_user: Annotated[UserResponse, Depends(get_current_superuser)],
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[UserResponse]:
+    user_service: UserService = Depends(get_user_service)
+) -> Response:
     """
     Update user information.
     
@@ -158,55 +160,79 @@ async def update_user(
         user_id: User ID
         user_data: Updated user data
         current_user: Current authenticated superuser
-        db: Database session
+        user_service: User service
         
     Returns:
         Updated user data
     """
-    logger.info(f"Update user request for ID: {user_id}")
+    logger.info("Update user request for ID: %s", user_id)
     
-    try:
-        user_service = UserService(db)
-        updated_user = await user_service.update_user(user_id, user_data)
-        
-        return ApiResponse(
-            success=True,
-            data=updated_user,
-            message="User updated successfully"
-        )
+    updated_user = await user_service.update_user(user_id, user_data)
+    await asyncio.gather(
+        token_cache.invalidate_user(user_id),
+        token_blacklist.revoke_user(user_id),
+    )
     
-    except NotFoundException as e:
-        logger.warning(f"User not found: {user_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=e.message
-        )
+    api_response = UserDetailResponse.model_construct(
+        success=True,
+        data=updated_user,
+        message="User updated successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        media_type="application/json",
+    )
+
+
+async def reject_self_delete(
+    user_id: int,
+    current_user: Annotated[UserResponse, Depends(get_current_superuser)]
+) -> UserResponse:
+    """
+    Get the current superuser, rejecting deletion of their own account.
     
-    except Exception as e:
-        logger.exception(f"Error updating user: {str(e)}")
+    Chained after the superuser check, so non-superusers get 403 whichever
+    ID they target and learn nothing about their own ID.
+    
+    Args:
+        user_id: User ID to delete
+        current_user: Current authenticated superuser
+        
+    Returns:
+        Current authenticated superuser
+        
+    Raises:
+        HTTPException: If the caller targets their own account
+    """
+    if user_id == current_user.id:
+        logger.warning("User tried to delete themselves: %s", current_user.id)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot delete yourself"
         )
+    return current_user
 
 
 @router.delete(
     "/users/{user_id}",
-    response_model=ApiResponse[None],
+    response_model=None,
     summary="Delete user",
     description="Delete user (admin only)",
     responses={
-        200: {"description": "User deleted successfully"},
+        200: {"model": EmptyResponse, "description": "User deleted successfully"},
+        400: {"description": "Cannot delete yourself"},
         404: {"description": "User not found"},
         401: {"description": "Not authenticated"},
-        403: {"description": "Not authorized (admin only)"}
+        403: {"description": "Not authorized (admin only)"},
+        503: {"description": "Change saved, but existing access tokens could not be revoked"}
     }
 )
+@handle_service_errors
 async def delete_user(
     user_id: int,
-    current_user: Annotated[UserResponse, Depends(get_current_superuser)],
-    db: AsyncSession = Depends(get_db)
-) -> ApiResponse[None]:
+    current_user: Annotated[UserResponse, Depends(reject_self_delete)],
+    user_service: UserService = Depends(get_user_service)
+) -> Response:
     """
     Delete user.
     
@@ -216,39 +242,24 @@ async def delete_user(
     Args:
         user_id: User ID to delete
         current_user: Current authenticated superuser
-        db: Database session
+        user_service: User service
         
     Returns:
         Success message
     """
-    logger.info(f"Delete user request for ID: {user_id}")
+    logger.info("Delete user request for ID: %s", user_id)
     
-    if user_id == current_user.id:
-        logger.warning(f"User tried to delete themselves: {current_user.email}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot delete yourself"
-        )
+    await user_service.delete_user(user_id)
+    await asyncio.gather(
+        token_cache.invalidate_user(user_id),
+        token_blacklist.revoke_user(user_id),
+    )
     
-    try:
-        user_service = UserService(db)
-        await user_service.delete_user(user_id)
-        
-        return ApiResponse(
-            success=True,
-            message="User deleted successfully"
-        )
-    
-    except NotFoundException as e:
-        logger.warning(f"User not found: {user_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=e.message
-        )
-    
-    except Exception as e:
-        logger.exception(f"Error deleting user: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error"
-        )
+    api_response = EmptyResponse.model_construct(
+        success=True,
+        message="User deleted successfully"
+    )
+    return Response(
+        content=api_response.model_dump_json(),
+        media_type="application/json",
+    )
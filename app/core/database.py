@@ -4,27 +4,263 @@ Database configuration and session management.
 Provides async database connection and session management for Auth Service.
 """
 
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession
-from gravity_common.database import DatabaseConfig
+from typing import Any, AsyncGenerator, Dict, Optional
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+import logging
+import time
+
 from app.config import settings
+from app.core.metrics import DB_QUERY_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseManager:
+    """
+    Async engine and session factory.
+    
+    Owns a single connection pool per process. Each request gets exactly one
+    session from get_db; services receive that session and never open their own.
+    """
+    
+    def __init__(
+        self,
+        database_url: str,
+        echo: bool = False,
+        pool_size: int = 20,
+        max_overflow: int = 30,
+        pool_pre_ping: bool = True,
+        pool_timeout: float = 2.0,
+        pool_recycle: int = 1800,
+        isolation_level: Optional[str] = None,
+        statement_cache_size: int = 1024,
+        server_settings: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize database manager.
+        
+        Args:
+            database_url: SQLAlchemy async database URL
+            echo: Whether to log SQL statements
+            pool_size: Number of persistent pooled connections
+            max_overflow: Extra connections allowed above pool_size
+            pool_pre_ping: Whether to test connections on checkout
+            pool_timeout: Seconds to wait for a free connection before failing
+            pool_recycle: Seconds after which a connection is replaced on checkout
+            isolation_level: Optional isolation level for every connection
+            statement_cache_size: Prepared statements kept per connection
+            server_settings: PostgreSQL session settings applied on connect
+        """
+        engine_options = {"isolation_level": isolation_level} if isolation_level else {}
+        self.engine = create_async_engine(
+            database_url,
+            echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=pool_pre_ping,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            # Keep prepared statements per connection both in asyncpg and in
+            # SQLAlchemy's adapter, so repeated queries skip PARSE on the server.
+            # Compiled SQL is already shared across sessions by the engine's cache.
+            connect_args={
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": statement_cache_size,
+                "server_settings": server_settings or {},
+            },
+            **engine_options,
+        )
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        # Same pool; the READ ONLY characteristic is applied when a connection
+        # is checked out, so sessions that never query never touch the pool
+        self.readonly_session_factory = async_sessionmaker(
+            self.engine.execution_options(postgresql_readonly=True),
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+    
+    def session(self, readonly: bool = False) -> AsyncSession:
+        """
+        Create a session bound to the shared pool.
+        
+        No connection is checked out until the first statement runs.
+        
+        Args:
+            readonly: Run the session's transactions as READ ONLY
+        
+        Returns:
+            AsyncSession: Database session, usable as an async context manager
+        """
+        factory = self.readonly_session_factory if readonly else self.session_factory
+        return factory()
+    
+    async def get_session(self, readonly: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Yield a session bound to the shared pool.
+        
+        Args:
+            readonly: Run the session's transactions as READ ONLY
+        
+        Yields:
+            AsyncSession: Database session
+        """
+        async with self.session(readonly) as session:
+            yield session
+    
+    async def warm_up(self, connections: int) -> None:
+        """
+        Pre-open pooled connections so early requests skip the handshake.
+        
+        Opens the connections concurrently so each one is a distinct pool
+        member, runs SELECT 1 on each, then returns them to the pool.
+        Failures are logged; connections are then opened lazily as before.
+        
+        Args:
+            connections: Number of connections to open
+        """
+        results = await asyncio.gather(
+            *(self.engine.connect().start() for _ in range(connections)),
+            return_exceptions=True,
+        )
+        conns = [conn for conn in results if not isinstance(conn, BaseException)]
+        try:
+            await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+            logger.info(f"Database pool warmed with {len(conns)}/{connections} connections")
+        except Exception as e:
+            logger.warning(f"Database pool warm-up failed: {str(e)}")
+        finally:
+            await asyncio.gather(*(conn.close() for conn in conns), return_exceptions=True)
+    
+    async def health_check(self) -> bool:
+        """
+        Check database connectivity.
+        
+        Returns:
+            True if database responds, False otherwise
+        """
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.error(f"Database health check failed: {str(e)}")
+            return False
+    
+    async def close(self) -> None:
+        """Dispose of the engine and close pooled connections."""
+        await self.engine.dispose()
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    """Record the start time of a statement on the connection."""
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    """Observe the duration of a statement under its SQL operation."""
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    operation = statement.lstrip()[:6].upper()
+    DB_QUERY_DURATION.get(operation, DB_QUERY_DURATION["OTHER"]).observe(elapsed)
+
+
+def _handle_error(context: Any) -> None:
+    """Discard the start time of a statement that failed."""
+    if context.connection is not None:
+        stack = context.connection.info.get("query_start_time")
+        if stack:
+            stack.pop()
 
 
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Time every statement executed by an engine.
+    
+    Listeners are registered once on the engine, so all queries are measured
+    without wrapping individual service methods.
+    
+    Args:
+        engine: Async engine to instrument
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+# TCP keepalives let the server notice connections silently dropped by NAT or
+# load balancers instead of holding them until the next query fails
+_SERVER_SETTINGS = {
+    "tcp_keepalives_idle": str(settings.DATABASE_TCP_KEEPALIVE_IDLE),
+    "tcp_keepalives_interval": str(settings.DATABASE_TCP_KEEPALIVE_INTERVAL),
+    "tcp_keepalives_count": str(settings.DATABASE_TCP_KEEPALIVE_COUNT),
+}
+
 # Initialize database configuration
-db_manager = DatabaseConfig(
+db_manager = DatabaseManager(
     database_url=settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+    server_settings=_SERVER_SETTINGS,
 )
 
+# Read-only workloads go to the replica when one is configured. Replica
+# sessions run in AUTOCOMMIT, so plain SELECTs skip BEGIN/COMMIT round-trips.
+if settings.DATABASE_READ_URL:
+    read_db_manager = DatabaseManager(
+        database_url=settings.DATABASE_READ_URL,
+        echo=settings.DATABASE_ECHO,
+        pool_size=settings.DATABASE_READ_POOL_SIZE,
+        max_overflow=settings.DATABASE_READ_MAX_OVERFLOW,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+        isolation_level="AUTOCOMMIT",
+        statement_cache_size=settings.DATABASE_STATEMENT_CACHE_SIZE,
+        server_settings=_SERVER_SETTINGS,
+    )
+else:
+    read_db_manager = db_manager
+
+if settings.PROMETHEUS_ENABLED:
+    instrument_engine(db_manager.engine)
+    if read_db_manager is not db_manager:
+        instrument_engine(read_db_manager.engine)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for getting database session.
     
+    FastAPI caches this dependency per request, so every dependency and
+    handler in one request shares a single session (and connection).
+    
     Yields:
         AsyncSession: Database session
     """
     async for session in db_manager.get_session():
         yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting a read-only database session.
+    
+    Uses the read replica when DATABASE_READ_URL is set, otherwise the primary.
+    Transactions are marked READ ONLY, so a stray write fails instead of
+    landing on the primary. Only use for endpoints that never write.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    async for session in read_db_manager.get_session(readonly=True):
+        yield session
@@ -0,0 +1,109 @@
+"""
+Non-blocking log output.
+
+Moves the handlers installed by setup_logging behind a queue, so request
+code only enqueues records while a background thread formats and writes
+them. Stopping a listener puts the original handlers back.
+"""
+
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    Queue handler for a listener in the same process.
+    
+    The base class formats the record before enqueueing and drops exc_info,
+    which would lose structured exception fields in JSON output. Here only
+    the message arguments are merged; formatting is left to the real handlers.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Freeze the message so later changes to its arguments are not logged.
+        
+        Works on a copy, so other handlers of the logger see the original record.
+        
+        Args:
+            record: Log record to enqueue
+        
+        Returns:
+            Copy of the record with the message merged
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _LoggerQueueListener(QueueListener):
+    """Queue listener that hands its handlers back to the logger on stop."""
+    
+    def __init__(
+        self,
+        target: logging.Logger,
+        queue_handler: QueueHandler,
+        log_queue: queue.SimpleQueue,
+        *handlers: logging.Handler
+    ):
+        """
+        Initialize listener.
+        
+        Args:
+            target: Logger whose handlers were moved to this listener
+            queue_handler: Queue handler installed on the logger in their place
+            log_queue: Queue shared with the queue handler
+            handlers: Original handlers of the logger
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.target = target
+        self.queue_handler = queue_handler
+    
+    def stop(self) -> None:
+        """
+        Restore the original handlers, then flush pending records.
+        
+        Records logged after this call are written directly instead of being
+        queued with nobody left to read them.
+        """
+        self.target.removeHandler(self.queue_handler)
+        for handler in self.handlers:
+            self.target.addHandler(handler)
+        super().stop()
+
+
+def start_queue_logging(*loggers: logging.Logger) -> List[QueueListener]:
+    """
+    Route the given loggers' handlers through background listeners.
+    
+    Each logger's handlers are replaced by a single queue handler and moved to
+    a started listener thread. Loggers without handlers are left untouched.
+    
+    Args:
+        loggers: Loggers configured by setup_logging
+    
+    Returns:
+        Started listeners; stop them on shutdown to flush pending records and
+        restore the original handlers
+    """
+    listeners = []
+    for target in dict.fromkeys(loggers):
+        handlers = list(target.handlers)
+        if not handlers:
+            continue
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = _InProcessQueueHandler(log_queue)
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(queue_handler)
+        
+        listener = _LoggerQueueListener(target, queue_handler, log_queue, *handlers)
+        listener.start()
+        listeners.append(listener)
+    
+    return listeners
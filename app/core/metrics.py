@@ -0,0 +1,38 @@
+"""
+Prometheus metrics for Auth Service.
+
+Business metrics exported next to the HTTP metrics from the instrumentator.
+Children for fixed label values are bound once at import time, so the hot
+path increments them directly instead of resolving labels per request.
+"""
+
+from prometheus_client import Counter, Histogram
+
+
+auth_login_attempts_total = Counter(
+    "auth_login_attempts",
+    "Login attempts by outcome",
+    ["status"],
+)
+
+auth_login_failures_total = Counter(
+    "auth_login_failures",
+    "Failed login attempts by reason",
+    ["reason"],
+)
+
+auth_db_query_duration_seconds = Histogram(
+    "auth_db_query_duration_seconds",
+    "Database statement execution time by SQL operation",
+    ["operation"],
+)
+
+# Pre-bound label children
+LOGIN_SUCCESS = auth_login_attempts_total.labels(status="success")
+LOGIN_FAILURE = auth_login_attempts_total.labels(status="failure")
+LOGIN_INVALID = auth_login_failures_total.labels(reason="invalid_credentials")
+LOGIN_INACTIVE = auth_login_failures_total.labels(reason="account_inactive")
+DB_QUERY_DURATION = {
+    operation: auth_db_query_duration_seconds.labels(operation=operation)
+    for operation in ("SELECT", "INSERT", "UPDATE", "DELETE", "OTHER")
+}
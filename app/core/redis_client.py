@@ -4,13 +4,214 @@ Redis client for token blacklist and caching.
 Manages Redis connections for the auth service.
 """
 
-from gravity_common.redis_client import RedisClient
+from typing import Any, List, Optional, Set
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.asyncio.client import Pipeline
+import logging
+
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+class RedisClient:
+    """
+    Thin async wrapper over a pooled redis.asyncio client.
+    
+    Exposes only the commands the service uses, with the same call
+    signatures as the previous gravity_common client.
+    """
+    
+    def __init__(
+        self,
+        redis_url: str,
+        max_connections: int = 50,
+        decode_responses: bool = True,
+        health_check_interval: int = 30,
+        socket_keepalive: bool = True,
+        pool_timeout: float = 2.0,
+    ):
+        """
+        Initialize Redis client.
+        
+        The connection pool is created here; sockets are opened lazily.
+        When every connection is busy, callers wait up to ``pool_timeout``
+        for one to be released instead of failing immediately.
+        
+        Args:
+            redis_url: Redis connection URL
+            max_connections: Maximum pooled connections
+            decode_responses: Whether to decode replies to str
+            health_check_interval: Seconds idle before a connection is pinged on reuse
+            socket_keepalive: Whether to enable TCP keepalive on sockets
+            pool_timeout: Seconds to wait for a free connection before failing
+        """
+        pool = BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            decode_responses=decode_responses,
+            health_check_interval=health_check_interval,
+            socket_keepalive=socket_keepalive,
+        )
+        # from_pool hands ownership to the client, so aclose() closes the pool
+        self.client = Redis.from_pool(pool)
+    
+    async def connect(self) -> None:
+        """Verify connectivity on startup."""
+        await self.client.ping()
+    
+    async def disconnect(self) -> None:
+        """Close pooled connections."""
+        await self.client.aclose()
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value by key.
+        
+        Args:
+            key: Redis key
+        
+        Returns:
+            Stored value, or None if missing
+        """
+        return await self.client.get(key)
+    
+    async def mget(self, *keys: str) -> List[Optional[Any]]:
+        """
+        Get several values in one round-trip.
+        
+        Args:
+            keys: Redis keys
+        
+        Returns:
+            Stored values in key order, None for missing keys
+        """
+        return await self.client.mget(keys)
+    
+    async def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """
+        Set value with optional expiration.
+        
+        Args:
+            key: Redis key
+            value: Value to store
+            expire: TTL in seconds
+        """
+        await self.client.set(key, value, ex=expire)
+    
+    async def delete(self, *keys: str) -> int:
+        """
+        Delete keys.
+        
+        Args:
+            keys: Redis keys
+        
+        Returns:
+            Number of keys removed
+        """
+        return await self.client.delete(*keys)
+    
+    async def exists(self, *keys: str) -> bool:
+        """
+        Check if any of the keys exists.
+        
+        Args:
+            keys: Redis keys, checked in one EXISTS command
+        
+        Returns:
+            True if at least one key exists
+        """
+        return bool(await self.client.exists(*keys))
+    
+    async def incr(self, key: str) -> int:
+        """
+        Atomically increment a counter.
+        
+        Args:
+            key: Redis key
+        
+        Returns:
+            Counter value after increment
+        """
+        return await self.client.incr(key)
+    
+    async def incr_with_expire(self, key: str, seconds: int) -> int:
+        """
+        Atomically increment a counter and start its expiry window.
+        
+        INCR and EXPIRE NX run in one MULTI block, so the key can never be
+        left without a TTL; an existing TTL is not extended.
+        
+        Args:
+            key: Redis key
+            seconds: TTL in seconds applied when the key has none
+        
+        Returns:
+            Counter value after increment
+        """
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, seconds, nx=True)
+            count, _ = await pipe.execute()
+        return count
+    
+    async def sadd(self, key: str, *members: str) -> int:
+        """
+        Add members to a set.
+        
+        Args:
+            key: Redis key
+            members: Members to add
+        
+        Returns:
+            Number of members added
+        """
+        return await self.client.sadd(key, *members)
+    
+    async def smembers(self, key: str) -> Set[str]:
+        """
+        Get all members of a set.
+        
+        Args:
+            key: Redis key
+        
+        Returns:
+            Set members, empty if the key is missing
+        """
+        return await self.client.smembers(key)
+    
+    def pipeline(self) -> Pipeline:
+        """
+        Start a non-transactional pipeline.
+        
+        Queued commands are sent in a single round-trip on ``execute()``.
+        
+        Returns:
+            Pipeline bound to the shared pool
+        """
+        return self.client.pipeline(transaction=False)
+    
+    async def health_check(self) -> bool:
+        """
+        Check Redis connectivity.
+        
+        Returns:
+            True if Redis responds, False otherwise
+        """
+        try:
+            return bool(await self.client.ping())
+        except Exception as e:
+            logger.error(f"Redis health check failed: {str(e)}")
+            return False
+
 
 # Initialize Redis client
 redis_client = RedisClient(
     redis_url=settings.REDIS_URL,
     max_connections=settings.REDIS_MAX_CONNECTIONS,
     decode_responses=True,
+    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+    socket_keepalive=settings.REDIS_SOCKET_KEEPALIVE,
+    pool_timeout=settings.REDIS_POOL_TIMEOUT,
 )
@@ -0,0 +1,163 @@
+"""
+Security helpers for Auth Service.
+
+Runs CPU-bound password hashing off the event loop, derives the keys
+used to cache successful password checks, hashes refresh tokens for
+storage, and decodes JWTs with a key prepared once at import.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Mapping
+
+from jose import jwt
+
+from app.config import settings
+from gravity_common.security import get_password_hash, verify_password
+
+
+# bcrypt releases the GIL while hashing, so threads run it in parallel across cores
+_BCRYPT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# JWT verification runs on every authenticated request; encode the HMAC key
+# and pin the accepted algorithms once instead of per call
+_JWT_KEY = settings.JWT_SECRET_KEY.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password without blocking the event loop.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        bcrypt hash
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, get_password_hash, password)
+
+
+async def check_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password against its hash without blocking the event loop.
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Stored bcrypt hash
+        
+    Returns:
+        True if the password matches
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
+
+
+def password_cache_key(user_id: int, hashed_password: str, password: str) -> str:
+    """
+    Build the Redis key marking a recently verified password.
+    
+    The key is an HMAC under SECRET_KEY, so Redis never holds a value from
+    which the password can be recovered. It also covers the stored hash, so
+    changing or resetting the password invalidates it implicitly.
+    
+    Args:
+        user_id: User ID
+        hashed_password: Stored bcrypt hash
+        password: Plain text password being verified
+        
+    Returns:
+        Redis key for the verification cache entry
+    """
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(),
+        f"{user_id}:{hashed_password}:{password}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"pw:{digest}"
+
+
+def decode_jwt(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode a JWT signed with JWT_SECRET_KEY.
+    
+    Args:
+        token: Encoded JWT
+        
+    Returns:
+        Token claims
+        
+    Raises:
+        JWTError: If the signature is invalid or the token has expired
+    """
+    return jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+
+
+def blacklist_key(payload: Mapping[str, Any], token: str) -> str:
+    """
+    Build the Redis key marking a revoked access token.
+    
+    Uses the short ``jti`` claim; tokens issued before jti existed fall back
+    to a digest of the token so the raw JWT is never used as a key.
+    
+    Args:
+        payload: Decoded token claims
+        token: Encoded access token
+        
+    Returns:
+        Redis key for the blacklist entry
+    """
+    jti = payload.get("jti")
+    if jti:
+        return f"bl:{jti}"
+    return f"bl:{hashlib.sha256(token.encode()).hexdigest()[:32]}"
+
+
+def user_revocation_key(user_id: Any) -> str:
+    """
+    Build the Redis key holding when a user's access tokens were last revoked.
+    
+    Args:
+        user_id: User ID (the token's ``sub`` claim)
+        
+    Returns:
+        Redis key for the user's revocation timestamp
+    """
+    return f"blu:{user_id}"
+
+
+def legacy_blacklist_key(token: str) -> str:
+    """
+    Build the blacklist key used before keys were derived from the jti.
+    
+    Only needed until tokens revoked under the old format have expired.
+    
+    Args:
+        token: Encoded access token
+        
+    Returns:
+        Legacy Redis key for the blacklist entry
+    """
+    return f"blacklist:{token}"
+
+
+def refresh_token_digest(token: str) -> bytes:
+    """
+    Hash a refresh token for storage and lookup.
+    
+    Returns the raw 32-byte SHA-256 digest, stored as BYTEA so the unique
+    index holds fixed-width binary keys instead of 64-character hex text.
+    
+    Args:
+        token: Encoded refresh token
+        
+    Returns:
+        SHA-256 digest of the token
+    """
+    return hashlib.sha256(token.encode()).digest()
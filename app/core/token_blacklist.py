@@ -0,0 +1,167 @@
+"""
+Access token blacklist.
+
+Revoked tokens are recorded in Redis. Lookups that find no entry are
+remembered in-process for a few seconds, so most authenticated requests
+skip the Redis EXISTS round-trip.
+
+Revoking a user stores the revocation time; tokens of that user issued
+earlier (by their ``rev_ts`` claim) are then treated as blacklisted. This bounds how long profile claims
+served from a token can go stale after an admin changes the user.
+
+For one access token lifetime after a process starts, lookups also check the
+legacy ``blacklist:<token>`` key, so tokens revoked before the switch to
+jti-based keys stay revoked.
+"""
+
+import logging
+
+import time
+from typing import Any, Dict, List, Mapping
+
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.core.security import blacklist_key, legacy_blacklist_key, user_revocation_key
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationError(Exception):
+    """Raised when a user's access tokens could not be revoked."""
+
+
+class TokenBlacklist:
+    """
+    Redis blacklist with an in-process negative cache.
+    
+    Only "not blacklisted" answers are cached locally, for ``local_ttl``
+    seconds (BLACKLIST_PROPAGATION_SECONDS). A logout in this process evicts
+    the entry immediately; other workers may accept the revoked token for at
+    most ``local_ttl`` seconds. A ``local_ttl`` of 0 disables the local cache.
+    """
+    
+    def __init__(
+        self,
+        local_ttl: float,
+        local_max_entries: int,
+        token_lifetime: int,
+        legacy_window: float
+    ):
+        """
+        Initialize token blacklist.
+        
+        Args:
+            local_ttl: Lifetime of a local "not blacklisted" entry in seconds
+            local_max_entries: Maximum local entries
+            token_lifetime: Access token lifetime in seconds
+            legacy_window: Seconds from now during which legacy keys are also checked
+        """
+        self.local_ttl = local_ttl
+        self.local_max_entries = local_max_entries
+        self.token_lifetime = token_lifetime
+        self._legacy_until = time.monotonic() + legacy_window
+        self._not_blacklisted: Dict[str, float] = {}
+    
+    async def is_blacklisted(self, payload: Mapping[str, Any], token: str) -> bool:
+        """
+        Check whether an access token has been revoked.
+        
+        Args:
+            payload: Decoded token claims
+            token: Encoded access token
+        
+        Returns:
+            True if blacklisted, False otherwise
+        """
+        key = blacklist_key(payload, token)
+        now = time.monotonic()
+        expires_at = self._not_blacklisted.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                return False
+            self._not_blacklisted.pop(key, None)
+        
+        keys: List[str] = [key, user_revocation_key(payload.get("sub"))]
+        if now < self._legacy_until:
+            keys.append(legacy_blacklist_key(token))
+        blacklisted, revoked_at, *legacy = await redis_client.mget(*keys)
+        if blacklisted is not None or any(value is not None for value in legacy):
+            return True
+        if revoked_at is not None and self._issued_at(payload) < float(revoked_at):
+            return True
+        
+        if self.local_ttl <= 0:
+            return False
+        if len(self._not_blacklisted) >= self.local_max_entries:
+            self._not_blacklisted.pop(next(iter(self._not_blacklisted)))
+        self._not_blacklisted[key] = now + self.local_ttl
+        return False
+    
+    def _issued_at(self, payload: Mapping[str, Any]) -> float:
+        """
+        Get when a token was issued.
+        
+        Uses the sub-second ``rev_ts`` claim set by create_tokens. Tokens
+        issued before it existed fall back to ``iat`` or ``exp``; those whole
+        seconds predate any revocation recorded by this code.
+        
+        Args:
+            payload: Decoded token claims
+        
+        Returns:
+            Issue time as a Unix timestamp
+        """
+        issued_at = payload.get("rev_ts", payload.get("iat"))
+        if issued_at is not None:
+            return float(issued_at)
+        return float(payload["exp"]) - self.token_lifetime
+    
+    async def revoke_user(self, user_id: int) -> None:
+        """
+        Revoke every access token issued to a user so far.
+        
+        Local "not blacklisted" entries are dropped in this process; other
+        workers honour the revocation within ``local_ttl`` seconds. Tokens
+        issued after this call, e.g. on the user's next login, stay valid.
+        
+        Args:
+            user_id: User ID
+        
+        Raises:
+            TokenRevocationError: If the revocation could not be stored; the
+                user's tokens then stay valid until they expire
+        """
+        self._not_blacklisted.clear()
+        try:
+            await redis_client.set(
+                user_revocation_key(user_id),
+                repr(time.time()),
+                expire=self.token_lifetime
+            )
+        except Exception as e:
+            logger.error("Token revocation failed for user %s: %s", user_id, e)
+            raise TokenRevocationError(
+                f"access tokens of user {user_id} could not be revoked"
+            ) from e
+    
+    async def add(self, payload: Mapping[str, Any], token: str, ttl: int) -> None:
+        """
+        Blacklist an access token.
+        
+        Args:
+            payload: Decoded token claims
+            token: Encoded access token
+            ttl: Seconds until the token expires
+        """
+        key = blacklist_key(payload, token)
+        self._not_blacklisted.pop(key, None)
+        await redis_client.set(key, "1", expire=ttl)
+
+
+# Global token blacklist instance
+token_blacklist = TokenBlacklist(
+    local_ttl=settings.BLACKLIST_PROPAGATION_SECONDS,
+    local_max_entries=settings.BLACKLIST_LOCAL_MAX_ENTRIES,
+    token_lifetime=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    legacy_window=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
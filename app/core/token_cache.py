@@ -0,0 +1,200 @@
+"""
+Token validation cache.
+
+Cache-aside layers for resolved access tokens, so repeated authenticated
+requests skip the user lookup in PostgreSQL: a short-lived in-process map
+(L1) in front of Redis (L2).
+"""
+
+import hashlib
+import logging
+import time
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.schemas.auth import UserResponse
+
+logger = logging.getLogger(__name__)
+
+
+def token_cache_key(token: str) -> str:
+    """
+    Build the Redis key for a token.
+    
+    The raw JWT is never stored; the key is derived from its SHA-256 digest.
+    
+    Args:
+        token: JWT access token
+    
+    Returns:
+        Redis key for the cached token entry
+    """
+    return f"tok:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def user_tokens_key(user_id: int) -> str:
+    """
+    Build the Redis key of the set indexing a user's cached tokens.
+    
+    Args:
+        user_id: User ID
+    
+    Returns:
+        Redis key for the user's token index
+    """
+    return f"tokusr:{user_id}"
+
+
+class TokenCache:
+    """
+    In-process and Redis cache of users resolved from access tokens.
+    
+    Redis entries live for at most ``max_ttl`` seconds and never outlive the
+    token. In-process entries live for ``local_ttl`` seconds, which bounds how
+    long another worker can serve a user after invalidate_user.
+    Redis failures are treated as cache misses so authentication keeps working.
+    """
+    
+    def __init__(self, max_ttl: int, local_ttl: int, local_max_entries: int):
+        """
+        Initialize token cache.
+        
+        Args:
+            max_ttl: Upper bound for Redis entry lifetime in seconds
+            local_ttl: In-process entry lifetime in seconds
+            local_max_entries: Maximum in-process entries
+        """
+        self.max_ttl = max_ttl
+        self.local_ttl = local_ttl
+        self.local_max_entries = local_max_entries
+        self._local: Dict[str, Tuple[float, UserResponse]] = {}
+    
+    def _get_local(self, key: str) -> Optional[UserResponse]:
+        """
+        Get an unexpired in-process entry.
+        
+        Args:
+            key: Token cache key
+        
+        Returns:
+            Cached user data, or None on miss
+        """
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            self._local.pop(key, None)
+            return None
+        return user
+    
+    def _set_local(self, key: str, user: UserResponse, ttl: int) -> None:
+        """
+        Store an in-process entry, evicting the oldest when full.
+        
+        Args:
+            key: Token cache key
+            user: User resolved from the token
+            ttl: Entry lifetime in seconds
+        """
+        if len(self._local) >= self.local_max_entries:
+            self._local.pop(next(iter(self._local)))
+        self._local[key] = (time.monotonic() + min(ttl, self.local_ttl), user)
+    
+    async def get(self, token: str) -> Optional[UserResponse]:
+        """
+        Get cached user for token.
+        
+        Args:
+            token: JWT access token
+        
+        Returns:
+            Cached user data, or None on miss
+        """
+        key = token_cache_key(token)
+        user = self._get_local(key)
+        if user is not None:
+            return user
+        
+        try:
+            cached = await redis_client.get(key)
+        except Exception as e:
+            logger.warning("Token cache read failed: %s", e)
+            return None
+        
+        if cached is None:
+            return None
+        
+        user = UserResponse.model_validate_json(cached)
+        self._set_local(key, user, self.local_ttl)
+        return user
+    
+    async def set(self, token: str, user: UserResponse, exp: int) -> None:
+        """
+        Cache resolved user for token.
+        
+        Args:
+            token: JWT access token
+            user: User resolved from the token
+            exp: Token expiration timestamp
+        """
+        ttl = min(exp - int(time.time()), self.max_ttl)
+        if ttl <= 0:
+            return
+        
+        key = token_cache_key(token)
+        self._set_local(key, user, ttl)
+        
+        try:
+            index_key = user_tokens_key(user.id)
+            async with redis_client.pipeline() as pipe:
+                pipe.set(key, user.model_dump_json(), ex=ttl)
+                pipe.sadd(index_key, key)
+                pipe.expire(index_key, self.max_ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Token cache write failed: %s", e)
+    
+    async def delete(self, token: str) -> None:
+        """
+        Invalidate cached entry for token.
+        
+        Args:
+            token: JWT access token
+        """
+        key = token_cache_key(token)
+        self._local.pop(key, None)
+        try:
+            await redis_client.delete(key)
+        except Exception as e:
+            logger.warning("Token cache delete failed: %s", e)
+    
+    async def invalidate_user(self, user_id: int) -> None:
+        """
+        Invalidate every cached token of a user.
+        
+        Call after the user's row changes so stale flags (is_active,
+        is_superuser) stop being served. A Redis failure is logged and leaves
+        the Redis entries to expire within ``max_ttl`` seconds.
+        
+        Args:
+            user_id: User ID
+        """
+        for key in [k for k, (_, user) in self._local.items() if user.id == user_id]:
+            self._local.pop(key, None)
+        
+        index_key = user_tokens_key(user_id)
+        try:
+            keys = await redis_client.smembers(index_key)
+            await redis_client.delete(index_key, *keys)
+        except Exception as e:
+            logger.warning("Token cache invalidation failed for user %s: %s", user_id, e)
+
+
+# Global token cache instance
+token_cache = TokenCache(
+    max_ttl=settings.TOKEN_CACHE_TTL_SECONDS,
+    local_ttl=settings.TOKEN_CACHE_LOCAL_TTL_SECONDS,
+    local_max_entries=settings.TOKEN_CACHE_LOCAL_MAX_ENTRIES,
+)
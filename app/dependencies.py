@@ -4,24 +4,138 @@ Dependency functions for FastAPI.
 Provides dependencies for authentication and authorization.
 """
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import OAuth2PasswordBearer
+from jose import JWTError
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import Annotated
+from typing import Annotated, Any, Awaitable, Callable, Dict, Type, TypeVar
+import asyncio
 import logging
 
 from app.models.user import User
 from app.schemas.auth import UserResponse
-from app.core.database import get_db
-from app.core.redis_client import redis_client
+from app.core.database import get_db, get_read_db
+from app.core.token_blacklist import token_blacklist
+from app.core.token_cache import token_cache
+from app.services.role_service import RoleService
+from app.services.user_service import USER_RESPONSE_COLUMNS, UserService, user_response_from_row
 from app.config import settings
-from gravity_common.security import decode_access_token
+from app.core.security import decode_jwt
 from gravity_common.exceptions import UnauthorizedException
 
 logger = logging.getLogger(__name__)
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/login")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl=settings.login_url)
+
+ModelT = TypeVar("ModelT")
+
+# Errors meaning the token itself is bad: signature/expiry failures and missing
+# or malformed claims. Anything else (database, Redis) is not a 401.
+_TOKEN_ERRORS = (JWTError, KeyError, TypeError, ValueError)
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a dependency that validates the raw JSON body with a cached TypeAdapter.
+    
+    The adapter is created once per route at import time and validates the
+    request bytes directly, skipping FastAPI's dict round-trip. Pair it with
+    json_body_openapi on the route so the request schema stays documented.
+    
+    Args:
+        model: Pydantic model for the request body
+        
+    Returns:
+        Dependency returning the validated model
+        
+    Raises:
+        RequestValidationError: If the body is not valid for the model
+    """
+    adapter = TypeAdapter(model)
+    
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+    
+    return dependency
+
+
+def json_body_openapi(model: Type[Any]) -> Dict[str, Any]:
+    """
+    Build the openapi_extra entry documenting a json_body request body.
+    
+    Args:
+        model: Pydantic model for the request body
+        
+    Returns:
+        openapi_extra mapping for the route decorator
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
+async def get_current_user_claims(
+    token: Annotated[str, Depends(oauth2_scheme)]
+) -> UserResponse:
+    """
+    Get current authenticated user from JWT claims only.
+    
+    Verifies the token signature and expiration in-process and builds the
+    user from the profile claims embedded at login, without touching the
+    database. Admin changes to the user revoke their earlier tokens through
+    the blacklist; use get_current_user when fresh database state is required.
+    
+    Args:
+        token: JWT access token
+        
+    Returns:
+        Current user data as of token issuance
+        
+    Raises:
+        HTTPException: If token is invalid, blacklisted or lacks profile claims
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    
+    try:
+        # Decode token
+        payload = decode_jwt(token)
+        
+        # Check if token is blacklisted
+        if await token_blacklist.is_blacklisted(payload, token):
+            logger.warning("Attempted use of blacklisted token")
+            raise credentials_exception
+        
+        # Tokens issued before profile claims existed fail here and must be refreshed
+        return UserResponse(
+            id=int(payload["sub"]),
+            email=payload["email"],
+            first_name=payload.get("first_name"),
+            last_name=payload.get("last_name"),
+            is_active=payload["is_active"],
+            is_superuser=payload["is_superuser"],
+            role_id=payload.get("role_id"),
+            created_at=payload["created_at"],
+            last_login=payload.get("last_login"),
+        )
+        
+    except _TOKEN_ERRORS as e:
+        logger.warning("Token claims validation failed: %s", e)
+        raise credentials_exception
 
 
 async def get_current_user(
@@ -48,52 +162,56 @@ async def get_current_user(
     )
     
     try:
-        # Check if token is blacklisted
-        is_blacklisted = await redis_client.exists(f"blacklist:{token}")
+        # Decode token
+        payload = decode_jwt(token)
+        
+        # Blacklist check and token cache lookup are independent round-trips
+        is_blacklisted, cached_user = await asyncio.gather(
+            token_blacklist.is_blacklisted(payload, token),
+            token_cache.get(token),
+        )
         if is_blacklisted:
             logger.warning("Attempted use of blacklisted token")
             raise credentials_exception
         
-        # Decode token
-        payload = decode_access_token(
-            token,
-            settings.JWT_SECRET_KEY,
-            settings.JWT_ALGORITHM
-        )
+        # Serve from token cache when the token was resolved recently
+        if cached_user is not None:
+            return cached_user
         
         user_id_str = payload.get("sub")
         if user_id_str is None:
             logger.warning("Token missing 'sub' claim")
             raise credentials_exception
         
-        # Get user from database
+        # Get user from database; the row is trusted, so skip re-validation
         result = await db.execute(
-            select(User).where(User.id == int(user_id_str))
+            select(*USER_RESPONSE_COLUMNS).where(User.id == int(user_id_str))
         )
-        user = result.scalar_one_or_none()
+        row = result.first()
         
-        if user is None:
+        if row is None:
             logger.warning(f"User not found for token: {user_id_str}")
             raise credentials_exception
         
-        return UserResponse.model_validate(user)
+        user_response = user_response_from_row(row)
+        await token_cache.set(token, user_response, payload["exp"])
+        
+        return user_response
         
-    except Exception as e:
-        logger.error(f"Error validating token: {str(e)}")
+    except _TOKEN_ERRORS as e:
+        logger.warning("Token validation failed: %s", e)
         raise credentials_exception
 
 
-async def get_current_active_user(
-    current_user: Annotated[UserResponse, Depends(get_current_user)]
-) -> UserResponse:
+def _ensure_active(current_user: UserResponse) -> UserResponse:
     """
-    Get current active user.
+    Reject inactive users.
     
     Args:
-        current_user: Current user from token
+        current_user: Resolved user
         
     Returns:
-        Active user data
+        The same user if active
         
     Raises:
         HTTPException: If user is inactive
@@ -108,8 +226,46 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_user(
+    current_user: Annotated[UserResponse, Depends(get_current_user_claims)]
+) -> UserResponse:
+    """
+    Get current active user from JWT claims (no database round-trip).
+    
+    Args:
+        current_user: Current user from token claims
+        
+    Returns:
+        Active user data
+        
+    Raises:
+        HTTPException: If user is inactive
+    """
+    return _ensure_active(current_user)
+
+
+async def get_current_active_db_user(
+    current_user: Annotated[UserResponse, Depends(get_current_user)]
+) -> UserResponse:
+    """
+    Get current active user from the database.
+    
+    Use for endpoints that act on fresh user state.
+    
+    Args:
+        current_user: Current user loaded from database
+        
+    Returns:
+        Active user data
+        
+    Raises:
+        HTTPException: If user is inactive
+    """
+    return _ensure_active(current_user)
+
+
 async def get_current_superuser(
-    current_user: Annotated[UserResponse, Depends(get_current_active_user)]
+    current_user: Annotated[UserResponse, Depends(get_current_active_db_user)]
 ) -> UserResponse:
     """
     Get current superuser.
@@ -131,3 +287,42 @@ async def get_current_superuser(
         )
     
     return current_user
+
+
+def get_role_service(db: AsyncSession = Depends(get_db)) -> RoleService:
+    """
+    Get role service bound to the request's primary session.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Role service
+    """
+    return RoleService(db)
+
+
+def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
+    """
+    Get user service bound to the request's primary session.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        User service
+    """
+    return UserService(db)
+
+
+def get_read_user_service(db: AsyncSession = Depends(get_read_db)) -> UserService:
+    """
+    Get user service bound to the request's read-only session.
+    
+    Args:
+        db: Read-only database session
+        
+    Returns:
+        User service
+    """
+    return UserService(db)
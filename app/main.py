@@ -5,16 +5,23 @@ Creates and configures the FastAPI application instance.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-from fastapi import FastAPI
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+import asyncio
+import logging
+import time
+
+import orjson
 
 from app.config import settings
 from app.api.v1 import auth, users, roles
-from app.core.database import db_manager
+from app.core.database import db_manager, read_db_manager
 from app.core.redis_client import redis_client
+from app.core.log_queue import start_queue_logging
 from gravity_common.exceptions import GravityException
 from gravity_common.logging_config import setup_logging
 
@@ -34,13 +41,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     
     Handles initialization and cleanup of database and Redis connections.
     """
+    # Format and write log records on a background thread, not the event loop
+    log_listeners = start_queue_logging(logging.getLogger(), logger)
     logger.info(f"Starting {settings.APP_NAME}...")
     
     # Initialize Redis
     await redis_client.connect()
     logger.info("Redis connection established")
     
-    # Database is initialized lazily on first request
+    # Pre-open pooled database connections
+    await db_manager.warm_up(settings.DATABASE_POOL_SIZE)
+    if read_db_manager is not db_manager:
+        await read_db_manager.warm_up(settings.DATABASE_READ_POOL_SIZE)
+    
     logger.info(f"{settings.APP_NAME} started successfully")
     
     yield
@@ -49,41 +62,55 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     logger.info(f"Shutting down {settings.APP_NAME}...")
     await redis_client.disconnect()
     await db_manager.close()
+    if read_db_manager is not db_manager:
+        await read_db_manager.close()
     logger.info(f"{settings.APP_NAME} shut down successfully")
+    for listener in log_listeners:
+        listener.stop()
 
 
-# Create FastAPI application
+# Create FastAPI application. Interactive docs and the OpenAPI schema are only
+# served in debug mode, so production never builds the schema.
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    openapi_url="/openapi.json" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 
-# Add CORS middleware
+# Add CORS middleware. Explicit allow-lists let Starlette build the preflight
+# headers once instead of echoing each request's headers back.
+CORS_ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_ALLOW_HEADERS = ("authorization", "content-type", "if-none-match", "x-request-id")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
     allow_credentials=settings.CORS_CREDENTIALS,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
 )
 
 
-# Add Prometheus instrumentation
+# Add Prometheus instrumentation. Handlers are labelled by route template and
+# unmatched paths are dropped, so label cardinality stays bounded.
 if settings.PROMETHEUS_ENABLED:
-    Instrumentator().instrument(app).expose(app)
+    Instrumentator(
+        should_ignore_untemplated=True,
+        excluded_handlers=["/metrics"],
+    ).instrument(app).expose(app)
 
 
 # Exception handlers
 @app.exception_handler(GravityException)
 async def gravity_exception_handler(request, exc: GravityException):
     """Handle custom Gravity exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -93,12 +120,45 @@ async def gravity_exception_handler(request, exc: GravityException):
     )
 
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc: Exception):
+    """Log unexpected errors once and return a generic 500."""
+    logger.error(
+        f"Unhandled error on {request.method} {request.url.path}: {str(exc)}",
+        exc_info=exc,
+    )
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request, exc: PoolTimeoutError):
+    """Fail fast with 503 when no database connection is available."""
+    logger.warning("Database pool exhausted")
+    return ORJSONResponse(
+        status_code=503,
+        content={
+            "success": False,
+            "error": "Service temporarily unavailable",
+            "details": None,
+        },
+    )
+
+
 # Include routers
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX, tags=["Authentication"])
 app.include_router(users.router, prefix=settings.API_V1_PREFIX, tags=["Users"])
 app.include_router(roles.router, prefix=settings.API_V1_PREFIX, tags=["Roles"])
 
 
+# Health probes from load balancers arrive every few seconds per instance;
+# reuse the last result briefly instead of hitting PostgreSQL and Redis each time
+HEALTH_CACHE_SECONDS = 2.0
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
@@ -106,16 +166,23 @@ async def health_check():
     Health check endpoint.
     
     Returns the health status of the service and its dependencies.
+    The result is cached for HEALTH_CACHE_SECONDS.
     """
-    # Check database
-    db_healthy = await db_manager.health_check()
+    global _health_cache
+    
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_SECONDS:
+        return _health_cache[1]
     
-    # Check Redis
-    redis_healthy = await redis_client.health_check()
+    # Check database and Redis concurrently
+    db_healthy, redis_healthy = await asyncio.gather(
+        db_manager.health_check(),
+        redis_client.health_check(),
+    )
     
     status = "healthy" if db_healthy and redis_healthy else "unhealthy"
     
-    return {
+    result = {
         "status": status,
         "service": settings.APP_NAME,
         "version": settings.API_VERSION,
@@ -124,16 +191,36 @@ async def health_check():
             "redis": "healthy" if redis_healthy else "unhealthy",
         },
     }
+    _health_cache = (now, result)
+    return result
+
+
+# Service information is static, so the root body is encoded once. A new
+# Response is still built per request: middleware mutates response headers.
+_ROOT_BODY = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.API_VERSION,
+    "description": settings.API_DESCRIPTION,
+    "docs": app.docs_url,
+    "health": "/health",
+})
 
 
 # Root endpoint
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with service information."""
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.API_VERSION,
-        "description": settings.API_DESCRIPTION,
-        "docs": "/docs",
-        "health": "/health",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+def create_app() -> FastAPI:
+    """
+    Get the application.
+    
+    Entry point for ``uvicorn app.main:create_app --factory`` and the test
+    client; the application itself is built once at import.
+    
+    Returns:
+        FastAPI application
+    """
+    return app
@@ -6,7 +6,8 @@ Database models representing users, roles, and refresh tokens.
 
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Text, JSON, func
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, LargeBinary, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from gravity_common.database import Base
 
@@ -26,23 +27,27 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String(255))
     first_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     last_name: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
     
     # Foreign key to roles
-    role_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("roles.id"), nullable=True)
+    role_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("roles.id"), nullable=True, index=True)
     
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), index=True)
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now(), nullable=True)
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
     role: Mapped[Optional["Role"]] = relationship("Role", back_populates="users")
-    refresh_tokens: Mapped[List["RefreshToken"]] = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+    refresh_tokens: Mapped[List["RefreshToken"]] = relationship(
+        "RefreshToken", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
     
     def __repr__(self) -> str:
-        return f"<User(id={self.id}, email='{self.email}')>"
+        """Describe the instance from loaded state; never triggers a lazy load."""
+        state = self.__dict__
+        return f"<User(id={state.get('id')}, email={state.get('email')!r})>"
 
 
 class Role(Base):
@@ -58,7 +63,7 @@ class Role(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(50), unique=True, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    permissions: Mapped[list] = mapped_column(JSON, default=list)  # List of permission strings
+    permissions: Mapped[list] = mapped_column(JSONB, default=list)  # List of permission strings
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
@@ -68,7 +73,9 @@ class Role(Base):
     users: Mapped[List["User"]] = relationship("User", back_populates="role")
     
     def __repr__(self) -> str:
-        return f"<Role(id={self.id}, name='{self.name}')>"
+        """Describe the instance from loaded state; never triggers a lazy load."""
+        state = self.__dict__
+        return f"<Role(id={state.get('id')}, name={state.get('name')!r})>"
 
 
 class RefreshToken(Base):
@@ -82,8 +89,8 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
-    token_hash: Mapped[str] = mapped_column(String(255), unique=True, index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    token_hash: Mapped[bytes] = mapped_column(LargeBinary(32), unique=True, index=True)
     expires_at: Mapped[datetime] = mapped_column(DateTime)
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False)
     
@@ -94,4 +101,6 @@ class RefreshToken(Base):
     user: Mapped["User"] = relationship("User", back_populates="refresh_tokens")
     
     def __repr__(self) -> str:
-        return f"<RefreshToken(id={self.id}, user_id={self.user_id})>"
+        """Describe the instance from loaded state; never triggers a lazy load."""
+        state = self.__dict__
+        return f"<RefreshToken(id={state.get('id')}, user_id={state.get('user_id')})>"
@@ -5,9 +5,47 @@ Data validation and serialization models for API requests and responses.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field, field_validator
-from gravity_common.models import BaseModel as GravityBaseModel
+import re
+from typing import Annotated, Optional, List
+from pydantic import AfterValidator, BaseModel, EmailStr, Field
+from gravity_common.models import ApiResponse, PaginatedResponse, BaseModel as GravityBaseModel
+
+# ASCII fast paths for the password checks; the per-character str methods
+# below only run when no ASCII match exists, keeping Unicode behaviour
+_HAS_ASCII_UPPER = re.compile(r"[A-Z]").search
+_HAS_ASCII_LOWER = re.compile(r"[a-z]").search
+_HAS_ASCII_DIGIT = re.compile(r"[0-9]").search
+
+
+def _validate_password_strength(v: str) -> str:
+    """
+    Require at least one uppercase letter, one lowercase letter and one digit.
+    
+    Args:
+        v: Password to check
+        
+    Returns:
+        The password unchanged
+        
+    Raises:
+        ValueError: If a character class is missing
+    """
+    if not (_HAS_ASCII_UPPER(v) or any(c.isupper() for c in v)):
+        raise ValueError("Password must contain at least one uppercase letter")
+    if not (_HAS_ASCII_LOWER(v) or any(c.islower() for c in v)):
+        raise ValueError("Password must contain at least one lowercase letter")
+    if not (_HAS_ASCII_DIGIT(v) or any(c.isdigit() for c in v)):
+        raise ValueError("Password must contain at least one digit")
+    return v
+
+
+# Password field shared by registration, change and reset: 8-100 characters
+# with an uppercase letter, a lowercase letter and a digit
+StrongPassword = Annotated[
+    str,
+    Field(min_length=8, max_length=100),
+    AfterValidator(_validate_password_strength),
+]
 
 
 # ==================== User Schemas ====================
@@ -21,27 +59,7 @@ class UserBase(GravityBaseModel):
 
 class UserCreate(UserBase):
     """Schema for user registration."""
-    password: str = Field(..., min_length=8, max_length=100, description="User password")
-    
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """
-        Validate password strength.
-        
-        Requirements:
-        - At least one uppercase letter
-        - At least one lowercase letter
-        - At least one digit
-        - Minimum 8 characters
-        """
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    password: StrongPassword = Field(..., description="User password")
 
 
 class UserUpdate(GravityBaseModel):
@@ -80,10 +98,19 @@ class Token(GravityBaseModel):
 class TokenPayload(GravityBaseModel):
     """Schema for JWT token payload."""
     sub: str = Field(..., description="Subject (user ID)")
+    jti: Optional[str] = Field(None, description="Token ID used for revocation")
     email: str = Field(..., description="User email")
     role: Optional[str] = Field(None, description="User role")
+    role_id: Optional[int] = Field(None, description="User's role ID")
+    first_name: Optional[str] = Field(None, description="First name")
+    last_name: Optional[str] = Field(None, description="Last name")
+    is_active: bool = Field(True, description="Whether user is active")
+    is_superuser: bool = Field(False, description="Whether user is superuser")
+    created_at: Optional[datetime] = Field(None, description="Account creation timestamp")
+    last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     exp: int = Field(..., description="Expiration timestamp")
     iat: int = Field(..., description="Issued at timestamp")
+    rev_ts: Optional[float] = Field(None, description="Sub-second issue time compared against user revocations")
     type: str = Field(default="access", description="Token type (access/refresh)")
 
 
@@ -101,19 +128,7 @@ class RefreshTokenRequest(GravityBaseModel):
 class ChangePasswordRequest(GravityBaseModel):
     """Schema for password change request."""
     old_password: str = Field(..., description="Current password")
-    new_password: str = Field(..., min_length=8, max_length=100, description="New password")
-    
-    @field_validator("new_password")
-    @classmethod
-    def validate_new_password(cls, v: str) -> str:
-        """Validate new password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    new_password: StrongPassword = Field(..., description="New password")
 
 
 class ForgotPasswordRequest(GravityBaseModel):
@@ -124,19 +139,7 @@ class ForgotPasswordRequest(GravityBaseModel):
 class ResetPasswordRequest(GravityBaseModel):
     """Schema for password reset request."""
     token: str = Field(..., description="Password reset token")
-    new_password: str = Field(..., min_length=8, max_length=100, description="New password")
-    
-    @field_validator("new_password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+    new_password: StrongPassword = Field(..., description="New password")
 
 
 # ==================== Role Schemas ====================
@@ -171,3 +174,51 @@ class RoleResponse(RoleBase):
 class AssignRoleRequest(GravityBaseModel):
     """Schema for assigning role to user."""
     role_id: int = Field(..., description="Role ID to assign")
+
+
+class UserRoleAssignment(GravityBaseModel):
+    """Single user-to-role assignment."""
+    user_id: int = Field(..., description="User ID")
+    role_id: int = Field(..., description="Role ID to assign")
+
+
+class BulkAssignRoleRequest(GravityBaseModel):
+    """Schema for assigning roles to many users at once."""
+    assignments: List[UserRoleAssignment] = Field(
+        ..., min_length=1, max_length=1000, description="Assignments to apply"
+    )
+
+
+class BulkAssignRoleResponse(GravityBaseModel):
+    """Schema for bulk role assignment result."""
+    updated: int = Field(..., description="Number of users updated")
+
+
+# ==================== Response Envelopes ====================
+# Concrete ApiResponse subclasses. Handlers build them out of already-validated
+# service models with model_construct (no validation pass) and serialize them
+# in one pass; response_model=None skips FastAPI's re-validation. The envelopes
+# stay under ``responses`` so OpenAPI lists them under their own names.
+
+class EmptyResponse(ApiResponse[None]):
+    """Response envelope without data."""
+
+
+class UserDetailResponse(ApiResponse[UserResponse]):
+    """Response envelope for a single user."""
+
+
+class UserPageResponse(ApiResponse[PaginatedResponse[UserResponse]]):
+    """Response envelope for a page of users."""
+
+
+class RoleDetailResponse(ApiResponse[RoleResponse]):
+    """Response envelope for a single role."""
+
+
+class RoleListResponse(ApiResponse[List[RoleResponse]]):
+    """Response envelope for the role list."""
+
+
+class BulkAssignResponse(ApiResponse[BulkAssignRoleResponse]):
+    """Response envelope for bulk role assignment."""
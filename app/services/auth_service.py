@@ -6,10 +6,15 @@ This service is completely independent and follows enterprise-grade patterns.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_
+from sqlalchemy import select, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from jose import JWTError
 import logging
+import secrets
+import time
 
 from app.models.user import User, RefreshToken, Role
 from app.schemas.auth import (
@@ -18,18 +23,53 @@ from app.schemas.auth import (
 )
 from app.config import settings
 from app.core.redis_client import redis_client
+from app.core.security import (
+    hash_password, check_password, password_cache_key, decode_jwt, refresh_token_digest
+)
+from app.core.token_blacklist import token_blacklist
+from app.services.role_cache import role_cache
 from gravity_common.security import (
-    verify_password, get_password_hash,
     create_access_token, create_refresh_token, decode_access_token
 )
 from gravity_common.exceptions import (
     UnauthorizedException, NotFoundException, ConflictException,
     BadRequestException
 )
-from gravity_common.utils import generate_random_string, generate_hash
+from gravity_common.utils import generate_random_string
 
 logger = logging.getLogger(__name__)
 
+# Token lifetimes; settings are frozen, so build the timedeltas once
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_ACCESS_TOKEN_TTL_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+PASSWORD_RESET_TTL_SECONDS = 3600
+_PASSWORD_RESET_TTL = timedelta(seconds=PASSWORD_RESET_TTL_SECONDS)
+
+# Default role IDs by role name, tagged with the roles version they were read at.
+# Creating a role bumps the version, so a stale entry is never reused.
+_DEFAULT_ROLE_IDS: Dict[str, Tuple[str, Optional[int]]] = {}
+
+# PostgreSQL error codes and the names the users.email unique constraint has
+# under alembic (users_email_key) and Base.metadata.create_all (ix_users_email)
+_UNIQUE_VIOLATION = "23505"
+_FOREIGN_KEY_VIOLATION = "23503"
+_EMAIL_UNIQUE_CONSTRAINTS = frozenset({"users_email_key", "ix_users_email"})
+
+
+def _integrity_violation(error: IntegrityError) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the SQLSTATE and constraint name behind an IntegrityError.
+    
+    Args:
+        error: Error raised by the asyncpg dialect
+        
+    Returns:
+        Tuple of (sqlstate, constraint_name); either may be None
+    """
+    cause = getattr(error.orig, "__cause__", None)
+    return getattr(cause, "sqlstate", None), getattr(cause, "constraint_name", None)
+
 
 class AuthService:
     """
@@ -43,6 +83,8 @@ class AuthService:
     - Role-based access control
     """
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: AsyncSession):
         """
         Initialize auth service.
@@ -68,50 +110,86 @@ class AuthService:
         """
         logger.info(f"Registering new user: {user_data.email} (superuser: {is_superuser})")
         
-        # Check if email already exists
-        result = await self.db.execute(
-            select(User).where(User.email == user_data.email)
-        )
-        existing_user = result.scalar_one_or_none()
-        
-        if existing_user:
-            logger.warning(f"Registration failed: Email already exists - {user_data.email}")
-            raise ConflictException(
-                message="Email already registered",
-                details={"email": user_data.email}
-            )
-        
         # Get default role (admin for superuser, user for regular)
         role_name = "admin" if is_superuser else "user"
-        result = await self.db.execute(
-            select(Role).where(Role.name == role_name)
-        )
-        user_role = result.scalar_one_or_none()
-        
-        # Create new user
-        new_user = User(
-            email=user_data.email,
-            hashed_password=get_password_hash(user_data.password),
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            is_active=True,
-            is_superuser=is_superuser,
-            role_id=user_role.id if user_role else None,
-            created_at=datetime.utcnow()
-        )
-        
-        self.db.add(new_user)
-        await self.db.commit()
+        hashed_password = await hash_password(user_data.password)
+        
+        for attempt in range(2):
+            role_id = await self._get_default_role_id(role_name)
+            
+            # Create new user
+            new_user = User(
+                email=user_data.email,
+                hashed_password=hashed_password,
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+                is_active=True,
+                is_superuser=is_superuser,
+                role_id=role_id,
+                created_at=datetime.utcnow()
+            )
+            
+            # The unique index on email rejects duplicates; no pre-check round-trip
+            self.db.add(new_user)
+            try:
+                await self.db.commit()
+                break
+            except IntegrityError as e:
+                await self.db.rollback()
+                sqlstate, constraint = _integrity_violation(e)
+                if sqlstate == _UNIQUE_VIOLATION and constraint in _EMAIL_UNIQUE_CONSTRAINTS:
+                    logger.warning(f"Registration failed: Email already exists - {user_data.email}")
+                    raise ConflictException(
+                        message="Email already registered",
+                        details={"email": user_data.email}
+                    )
+                if sqlstate == _FOREIGN_KEY_VIOLATION and attempt == 0:
+                    # The cached default role was deleted; re-read it and retry once
+                    logger.warning("Default role %s (ID: %s) no longer exists", role_name, role_id)
+                    _DEFAULT_ROLE_IDS.pop(role_name, None)
+                    continue
+                raise
         await self.db.refresh(new_user)
         
         logger.info(f"User registered successfully: {new_user.email} (ID: {new_user.id})")
         
         return UserResponse.model_validate(new_user)
     
+    async def _get_default_role_id(self, role_name: str) -> Optional[int]:
+        """
+        Get the ID of a default role, cached per process.
+        
+        Entries are reused while the roles version in Redis is unchanged.
+        If Redis is unavailable the role is read from the database uncached.
+        
+        Args:
+            role_name: Role name
+            
+        Returns:
+            Role ID, or None if the role does not exist
+        """
+        try:
+            version = await role_cache.current_version()
+        except Exception as e:
+            logger.warning("Roles version read failed: %s", e)
+            version = None
+        
+        cached = _DEFAULT_ROLE_IDS.get(role_name)
+        if version is not None and cached is not None and cached[0] == version:
+            return cached[1]
+        
+        role_id = await self.db.scalar(select(Role.id).where(Role.name == role_name))
+        if version is not None:
+            _DEFAULT_ROLE_IDS[role_name] = (version, role_id)
+        return role_id
+    
     async def authenticate_user(self, email: str, password: str) -> User:
         """
         Authenticate user with email and password.
         
+        Sets last_login without committing; the caller's next commit (on
+        login, the one in create_tokens) persists it with the refresh token.
+        
         Args:
             email: User email
             password: User password
@@ -124,8 +202,9 @@ class AuthService:
         """
         logger.debug(f"Authenticating user: {email}")
         
+        # Load the role in the same round-trip; create_tokens reads it from the identity map
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(User).options(joinedload(User.role)).where(User.email == email)
         )
         user = result.scalar_one_or_none()
         
@@ -143,20 +222,54 @@ class AuthService:
                 details={"reason": "account_inactive"}
             )
         
-        if not verify_password(password, user.hashed_password):
+        if not await self._verify_password_cached(user, password):
             logger.warning(f"Authentication failed: Invalid password - {email}")
             raise UnauthorizedException(
                 message="Invalid credentials",
                 details={"reason": "invalid_password"}
             )
         
-        # Update last login
+        # Update last login; flushed with the refresh token insert on login
         user.last_login = datetime.utcnow()
-        await self.db.commit()
         
         logger.info(f"User authenticated successfully: {email}")
         return user
     
+    async def _verify_password_cached(self, user: User, password: str) -> bool:
+        """
+        Verify password, skipping bcrypt for recently verified credentials.
+        
+        Successful checks are remembered in Redis for PASSWORD_VERIFY_CACHE_TTL
+        seconds. Redis errors fall back to a full bcrypt verification.
+        
+        Args:
+            user: User whose password is checked
+            password: Plain text password
+            
+        Returns:
+            True if the password matches
+        """
+        ttl = settings.PASSWORD_VERIFY_CACHE_TTL
+        if ttl <= 0:
+            return await check_password(password, user.hashed_password)
+        
+        cache_key = password_cache_key(user.id, user.hashed_password, password)
+        try:
+            if await redis_client.exists(cache_key):
+                return True
+        except Exception as e:
+            logger.warning("Password cache read failed: %s", e)
+        
+        if not await check_password(password, user.hashed_password):
+            return False
+        
+        try:
+            await redis_client.set(cache_key, "1", expire=ttl)
+        except Exception as e:
+            logger.warning("Password cache write failed: %s", e)
+        
+        return True
+    
     async def create_tokens(self, user: User) -> Token:
         """
         Create access and refresh tokens for user.
@@ -169,33 +282,44 @@ class AuthService:
         """
         logger.debug(f"Creating tokens for user: {user.email}")
         
-        # Load user role
+        # Load user role; an identity-map hit when the caller loaded it with the user
         if user.role_id:
-            result = await self.db.execute(
-                select(Role).where(Role.id == user.role_id)
-            )
-            role = result.scalar_one_or_none()
+            role = await self.db.get(Role, user.role_id)
             role_name = role.name if role else None
         else:
             role_name = None
         
         # Create access token
+        # Profile claims let get_current_user_claims build the user without a DB lookup
         access_token_data = {
             "sub": str(user.id),
+            "jti": secrets.token_urlsafe(12),
+            # Sub-second issue time set here rather than relying on the JWT
+            # helper's iat, so a login right after a revocation is not caught by it
+            "rev_ts": time.time(),
             "email": user.email,
             "role": role_name,
+            "role_id": user.role_id,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "created_at": user.created_at.isoformat(),
+            "last_login": user.last_login.isoformat() if user.last_login else None,
         }
         
         access_token = create_access_token(
             data=access_token_data,
             secret_key=settings.JWT_SECRET_KEY,
             algorithm=settings.JWT_ALGORITHM,
-            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            expires_delta=_ACCESS_TOKEN_TTL
         )
         
-        # Create refresh token
+        # Create refresh token; the jti keeps a token rotated within the same
+        # second from repeating its predecessor (token_hash is unique)
         refresh_token_data = {
             "sub": str(user.id),
+            "jti": secrets.token_urlsafe(12),
             "email": user.email,
         }
         
@@ -203,15 +327,15 @@ class AuthService:
             data=refresh_token_data,
             secret_key=settings.JWT_SECRET_KEY,
             algorithm=settings.JWT_ALGORITHM,
-            expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+            expires_delta=_REFRESH_TOKEN_TTL
         )
         
         # Store refresh token in database
-        token_hash = generate_hash(refresh_token, "sha256")
+        token_hash = refresh_token_digest(refresh_token)
         refresh_token_record = RefreshToken(
             user_id=user.id,
             token_hash=token_hash,
-            expires_at=datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            expires_at=datetime.utcnow() + _REFRESH_TOKEN_TTL,
             is_revoked=False
         )
         
@@ -224,7 +348,7 @@ class AuthService:
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="bearer",
-            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+            expires_in=_ACCESS_TOKEN_TTL_SECONDS
         )
     
     async def refresh_access_token(self, refresh_token: str) -> Token:
@@ -244,47 +368,45 @@ class AuthService:
         
         try:
             # Decode refresh token
-            payload = decode_access_token(
-                refresh_token,
-                settings.JWT_SECRET_KEY,
-                settings.JWT_ALGORITHM
-            )
+            payload = decode_jwt(refresh_token)
             
             user_id_str = payload.get("sub")
             if not user_id_str:
                 raise UnauthorizedException(message="Invalid refresh token")
             user_id = int(user_id_str)
             
-            # Verify refresh token in database
-            token_hash = generate_hash(refresh_token, "sha256")
-            result = await self.db.execute(
-                select(RefreshToken).where(
+            # Revoke the refresh token and load its user with role in one statement.
+            # The conditional UPDATE lets only one concurrent refresh use a token.
+            token_hash = refresh_token_digest(refresh_token)
+            rotated = (
+                update(RefreshToken)
+                .where(
                     RefreshToken.token_hash == token_hash,
+                    RefreshToken.user_id == user_id,
                     RefreshToken.is_revoked == False,
                     RefreshToken.expires_at > datetime.utcnow()
                 )
+                .values(is_revoked=True)
+                .returning(RefreshToken.user_id)
+                .cte("rotated")
             )
-            refresh_token_record = result.scalar_one_or_none()
-            
-            if not refresh_token_record:
-                logger.warning("Refresh token not found or expired")
-                raise UnauthorizedException(message="Invalid refresh token")
-            
-            # Get user
             result = await self.db.execute(
-                select(User).where(User.id == user_id)
+                select(User)
+                .options(joinedload(User.role))
+                .join(rotated, User.id == rotated.c.user_id)
             )
             user = result.scalar_one_or_none()
             
-            if not user or not user.is_active:
-                logger.warning(f"User not found or inactive: {user_id}")
-                raise UnauthorizedException(message="User not found or inactive")
+            if not user:
+                logger.warning("Refresh token not found or expired")
+                raise UnauthorizedException(message="Invalid refresh token")
             
-            # Revoke old refresh token
-            refresh_token_record.is_revoked = True
-            await self.db.commit()
+            if not user.is_active:
+                await self.db.rollback()
+                logger.warning(f"User inactive: {user_id}")
+                raise UnauthorizedException(message="User not found or inactive")
             
-            # Create new tokens
+            # Create new tokens; commits the revocation with the new token insert
             new_tokens = await self.create_tokens(user)
             
             logger.info(f"Access token refreshed for user: {user.email}")
@@ -305,11 +427,7 @@ class AuthService:
         
         try:
             # Decode token to get expiration
-            payload = decode_access_token(
-                access_token,
-                settings.JWT_SECRET_KEY,
-                settings.JWT_ALGORITHM
-            )
+            payload = decode_jwt(access_token)
             
             exp = payload.get("exp")
             user_email = payload.get("email")
@@ -317,15 +435,11 @@ class AuthService:
             # Calculate TTL (time until expiration)
             if not exp or not isinstance(exp, int):
                 return
-            ttl = exp - int(datetime.utcnow().timestamp())
+            ttl = exp - int(time.time())
             
             if ttl > 0:
-                # Add token to Redis blacklist
-                await redis_client.set(
-                    f"blacklist:{access_token}",
-                    "true",
-                    expire=ttl
-                )
+                # Add token to Redis blacklist; the entry expires with the token
+                await token_blacklist.add(payload, access_token, ttl)
                 
                 logger.info(f"User logged out successfully: {user_email}")
             
@@ -337,13 +451,19 @@ class AuthService:
         """
         Check if access token is blacklisted.
         
+        Tokens that fail verification are reported as blacklisted.
+        
         Args:
             access_token: Access token to check
             
         Returns:
-            True if blacklisted, False otherwise
+            True if blacklisted or invalid, False otherwise
         """
-        return await redis_client.exists(f"blacklist:{access_token}")
+        try:
+            payload = decode_jwt(access_token)
+        except JWTError:
+            return True
+        return await token_blacklist.is_blacklisted(payload, access_token)
     
     async def change_password(
         self,
@@ -364,22 +484,19 @@ class AuthService:
         logger.info(f"Changing password for user: {user_id}")
         
         # Get user
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
         
         if not user:
             logger.warning(f"User not found: {user_id}")
             raise NotFoundException(message="User not found")
         
         # Verify old password
-        if not verify_password(change_password_data.old_password, user.hashed_password):
+        if not await check_password(change_password_data.old_password, user.hashed_password):
             logger.warning(f"Password change failed: Invalid old password - {user.email}")
             raise BadRequestException(message="Invalid old password")
         
         # Update password
-        user.hashed_password = get_password_hash(change_password_data.new_password)
+        user.hashed_password = await hash_password(change_password_data.new_password)
         user.updated_at = datetime.utcnow()
         
         await self.db.commit()
@@ -421,14 +538,14 @@ class AuthService:
         reset_token = create_access_token(
             data=reset_token_data,
             secret_key=settings.SECRET_KEY,
-            expires_delta=timedelta(hours=1)
+            expires_delta=_PASSWORD_RESET_TTL
         )
         
         # Store in Redis with 1 hour expiration
         await redis_client.set(
             f"password_reset:{user.id}",
             reset_token,
-            expire=3600
+            expire=PASSWORD_RESET_TTL_SECONDS
         )
         
         logger.info(f"Password reset token generated for: {email}")
@@ -471,16 +588,13 @@ class AuthService:
                 raise UnauthorizedException(message="Invalid or expired reset token")
             
             # Get user
-            result = await self.db.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = result.scalar_one_or_none()
+            user = await self.db.get(User, user_id)
             
             if not user:
                 raise NotFoundException(message="User not found")
             
             # Update password
-            user.hashed_password = get_password_hash(reset_data.new_password)
+            user.hashed_password = await hash_password(reset_data.new_password)
             user.updated_at = datetime.utcnow()
             
             # Delete reset token from Redis
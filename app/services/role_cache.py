@@ -0,0 +1,149 @@
+"""
+Role list cache.
+
+Two-tier cache for the serialized GET /roles payload: an in-process copy (L1)
+in front of Redis (L2), both keyed by a roles version counter in Redis.
+Bumping the version invalidates every worker's L1 and the old L2 entry.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, List, Optional
+
+import orjson
+
+from app.core.redis_client import redis_client
+from app.schemas.auth import RoleListResponse, RoleResponse
+
+logger = logging.getLogger(__name__)
+
+ROLES_VERSION_KEY = "roles:v"
+ROLES_PAYLOAD_KEY = "roles:payload:{version}"
+ROLES_CACHE_TTL = 3600
+
+# How long a worker trusts its last read of the version before asking Redis again
+ROLES_VERSION_CHECK_SECONDS = 1.0
+
+
+def serialize_roles(roles: List[RoleResponse]) -> bytes:
+    """
+    Serialize the role list response body.
+    
+    Args:
+        roles: Roles to list
+    
+    Returns:
+        JSON body of RoleListResponse
+    """
+    api_response = RoleListResponse.model_construct(
+        success=True,
+        data=roles,
+        message="Roles retrieved successfully"
+    )
+    return orjson.dumps(api_response.model_dump())
+
+
+class RoleCache:
+    """
+    Versioned L1 + L2 cache of the role list response body.
+    
+    The L1 entry is reused for ROLES_VERSION_CHECK_SECONDS without touching
+    Redis; after that the version is re-read and a changed version drops it.
+    Misses are filled under a lock, so one worker runs at most one query.
+    """
+    
+    def __init__(self, ttl: int, version_check_seconds: float):
+        """
+        Initialize role cache.
+        
+        Args:
+            ttl: Lifetime of the Redis payload entry in seconds
+            version_check_seconds: Interval between Redis version reads
+        """
+        self.ttl = ttl
+        self.version_check_seconds = version_check_seconds
+        self._lock = asyncio.Lock()
+        self._version: Optional[str] = None
+        self._payload: Optional[bytes] = None
+        self._checked_at = 0.0
+    
+    async def current_version(self) -> str:
+        """
+        Get the roles version, re-reading Redis at most once per interval.
+        
+        Returns:
+            Current roles version
+        """
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.version_check_seconds:
+            return self._version
+        
+        version = await redis_client.get(ROLES_VERSION_KEY) or "0"
+        self._checked_at = now
+        if version != self._version:
+            self._version = version
+            self._payload = None
+        return version
+    
+    async def get_payload(self, load_roles: Callable[[], Awaitable[List[RoleResponse]]]) -> bytes:
+        """
+        Get the serialized role list response.
+        
+        Args:
+            load_roles: Loads the roles from the database; called only on a double miss
+        
+        Returns:
+            JSON body of RoleListResponse
+        """
+        version = await self.current_version()
+        payload = self._payload
+        if payload is not None:
+            return payload
+        
+        async with self._lock:
+            if self._payload is not None and self._version == version:
+                return self._payload
+            
+            key = ROLES_PAYLOAD_KEY.format(version=version)
+            try:
+                cached = await redis_client.get(key)
+            except Exception as e:
+                logger.warning("Role cache read failed: %s", e)
+                cached = None
+            if cached is not None:
+                payload = cached.encode()
+            else:
+                payload = serialize_roles(await load_roles())
+                try:
+                    await redis_client.set(key, payload.decode(), expire=self.ttl)
+                except Exception as e:
+                    logger.warning("Role cache write failed: %s", e)
+            
+            if self._version == version:
+                self._payload = payload
+            return payload
+    
+    async def invalidate(self) -> None:
+        """
+        Bump the roles version so every worker rebuilds its cache.
+        
+        This worker's copy is dropped first. If Redis is unavailable the
+        failure is logged; other workers then keep their copy until the
+        version changes or the Redis entry expires.
+        """
+        self._version = None
+        self._payload = None
+        try:
+            await redis_client.incr(ROLES_VERSION_KEY)
+        except Exception as e:
+            logger.warning("Role cache invalidation failed: %s", e)
+            return
+        logger.debug("Role cache invalidated")
+
+
+# Global role cache instance
+role_cache = RoleCache(
+    ttl=ROLES_CACHE_TTL,
+    version_check_seconds=ROLES_VERSION_CHECK_SECONDS,
+)
@@ -4,13 +4,14 @@ Role service layer.
 Business logic for role management and permissions.
 """
 
-from typing import List
+from typing import Dict, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text, update
+from sqlalchemy.exc import IntegrityError
 import logging
 
 from app.models.user import Role, User
-from app.schemas.auth import RoleCreate, RoleUpdate, RoleResponse
+from app.schemas.auth import RoleCreate, RoleUpdate, RoleResponse, UserRoleAssignment
 from gravity_common.exceptions import NotFoundException, ConflictException
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,21 @@ class RoleService:
     Handles CRUD operations for roles and role assignments.
     """
     
+    __slots__ = ("db",)
+    
+    # Parameter-free statements are built once per class, not per call
+    _LIST_ROLES_STMT = select(Role).order_by(Role.name)
+    
+    # Arrays keep the SQL text identical for any batch size, so the prepared
+    # statement is reused
+    _BULK_ASSIGN_STMT = text(
+        "UPDATE users SET role_id = data.role_id "
+        "FROM unnest(CAST(:user_ids AS integer[]), CAST(:role_ids AS integer[])) "
+        "AS data(user_id, role_id) "
+        "WHERE users.id = data.user_id "
+        "RETURNING users.id"
+    )
+    
     def __init__(self, db: AsyncSession):
         """
         Initialize role service.
@@ -84,9 +100,7 @@ class RoleService:
         """
         logger.debug("Listing all roles")
         
-        result = await self.db.execute(
-            select(Role).order_by(Role.name)
-        )
+        result = await self.db.execute(self._LIST_ROLES_STMT)
         roles = result.scalars().all()
         
         return [RoleResponse.model_validate(role) for role in roles]
@@ -106,10 +120,7 @@ class RoleService:
         """
         logger.debug(f"Fetching role with ID: {role_id}")
         
-        result = await self.db.execute(
-            select(Role).where(Role.id == role_id)
-        )
-        role = result.scalar_one_or_none()
+        role = await self.db.get(Role, role_id)
         
         if not role:
             logger.warning(f"Role not found: {role_id}")
@@ -134,10 +145,7 @@ class RoleService:
         logger.info(f"Updating role: {role_id}")
         
         # Get role
-        result = await self.db.execute(
-            select(Role).where(Role.id == role_id)
-        )
-        role = result.scalar_one_or_none()
+        role = await self.db.get(Role, role_id)
         
         if not role:
             logger.warning(f"Role not found: {role_id}")
@@ -168,28 +176,71 @@ class RoleService:
         """
         logger.info(f"Assigning role {role_id} to user {user_id}")
         
-        # Check if user exists
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        # One round-trip: RETURNING proves the user exists, the roles FK proves the role does
+        try:
+            result = await self.db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(role_id=role_id)
+                .returning(User.id)
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            logger.warning(f"Role not found: {role_id}")
+            raise NotFoundException(message=f"Role not found with ID: {role_id}")
         
-        if not user:
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
             logger.warning(f"User not found: {user_id}")
             raise NotFoundException(message=f"User not found with ID: {user_id}")
         
-        # Check if role exists
-        result = await self.db.execute(
-            select(Role).where(Role.id == role_id)
-        )
-        role = result.scalar_one_or_none()
+        await self.db.commit()
         
-        if not role:
-            logger.warning(f"Role not found: {role_id}")
-            raise NotFoundException(message=f"Role not found with ID: {role_id}")
+        logger.info(f"Role {role_id} assigned to user {user_id}")
+    
+    async def bulk_assign_roles(self, assignments: List[UserRoleAssignment]) -> List[int]:
+        """
+        Assign roles to many users in one statement.
+        
+        Either every assignment is applied or none is. When a user ID repeats,
+        the last assignment wins.
+        
+        Args:
+            assignments: User and role ID pairs
+            
+        Returns:
+            IDs of the updated users
+            
+        Raises:
+            NotFoundException: If any user or role is not found
+        """
+        role_by_user: Dict[int, int] = {a.user_id: a.role_id for a in assignments}
+        logger.info("Bulk assigning roles to %s users", len(role_by_user))
+        
+        try:
+            result = await self.db.execute(
+                self._BULK_ASSIGN_STMT,
+                {"user_ids": list(role_by_user), "role_ids": list(role_by_user.values())},
+            )
+        except IntegrityError:
+            await self.db.rollback()
+            logger.warning("Bulk role assignment references a missing role")
+            raise NotFoundException(
+                message="Role not found",
+                details={"role_ids": sorted(set(role_by_user.values()))}
+            )
+        
+        updated = result.scalars().all()
+        missing = sorted(set(role_by_user) - set(updated))
+        if missing:
+            await self.db.rollback()
+            logger.warning("Users not found for bulk role assignment: %s", missing)
+            raise NotFoundException(
+                message="User not found",
+                details={"user_ids": missing}
+            )
         
-        # Assign role
-        user.role_id = role_id
         await self.db.commit()
         
-        logger.info(f"Role {role.name} assigned to user {user.email}")
+        logger.info("Roles assigned to %s users", len(updated))
+        return list(updated)
@@ -4,7 +4,7 @@ User service layer.
 Business logic for user management operations.
 """
 
-from typing import List
+from typing import Any, List, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 import logging
@@ -16,6 +16,36 @@ from gravity_common.exceptions import NotFoundException
 
 logger = logging.getLogger(__name__)
 
+# Columns read into UserResponse
+USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.email,
+    User.first_name,
+    User.last_name,
+    User.is_active,
+    User.is_superuser,
+    User.role_id,
+    User.created_at,
+    User.last_login,
+)
+USER_RESPONSE_FIELDS = tuple(column.key for column in USER_RESPONSE_COLUMNS)
+
+
+def user_response_from_row(row: Sequence[Any]) -> UserResponse:
+    """
+    Build a UserResponse from a row selected with USER_RESPONSE_COLUMNS.
+    
+    Values come straight from typed columns, so the model is built without
+    re-validation. Extra trailing columns are ignored.
+    
+    Args:
+        row: Result row starting with USER_RESPONSE_COLUMNS
+        
+    Returns:
+        User data
+    """
+    return UserResponse.model_construct(**dict(zip(USER_RESPONSE_FIELDS, row)))
+
 
 class UserService:
     """
@@ -24,6 +54,8 @@ class UserService:
     Handles CRUD operations for users with pagination and filtering.
     """
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: AsyncSession):
         """
         Initialize user service.
@@ -49,15 +81,15 @@ class UserService:
         logger.debug(f"Fetching user with ID: {user_id}")
         
         result = await self.db.execute(
-            select(User).where(User.id == user_id)
+            select(*USER_RESPONSE_COLUMNS).where(User.id == user_id)
         )
-        user = result.scalar_one_or_none()
+        row = result.first()
         
-        if not user:
+        if row is None:
             logger.warning(f"User not found: {user_id}")
             raise NotFoundException(message=f"User not found with ID: {user_id}")
         
-        return UserResponse.model_validate(user)
+        return user_response_from_row(row)
     
     async def get_user_by_email(self, email: str) -> UserResponse:
         """
@@ -75,15 +107,15 @@ class UserService:
         logger.debug(f"Fetching user with email: {email}")
         
         result = await self.db.execute(
-            select(User).where(User.email == email)
+            select(*USER_RESPONSE_COLUMNS).where(User.email == email)
         )
-        user = result.scalar_one_or_none()
+        row = result.first()
         
-        if not user:
+        if row is None:
             logger.warning(f"User not found: {email}")
             raise NotFoundException(message=f"User not found with email: {email}")
         
-        return UserResponse.model_validate(user)
+        return user_response_from_row(row)
     
     async def list_users(self, pagination: PaginationParams) -> PaginatedResponse[UserResponse]:
         """
@@ -97,21 +129,27 @@ class UserService:
         """
         logger.debug(f"Listing users - page: {pagination.page}, size: {pagination.page_size}")
         
-        # Count total users
-        count_result = await self.db.execute(select(func.count(User.id)))
-        total = count_result.scalar() or 0
-        
-        # Get users for current page
+        # Get users for current page with the total in the same round-trip.
+        # Plain column rows skip ORM entity hydration and the identity map.
         result = await self.db.execute(
-            select(User)
+            select(*USER_RESPONSE_COLUMNS, func.count().over().label("total"))
             .offset(pagination.offset)
             .limit(pagination.page_size)
             .order_by(User.created_at.desc())
         )
-        users = result.scalars().all()
+        rows = result.all()
+        
+        if rows:
+            total = rows[0].total
+        elif pagination.page > 1:
+            # Past the last page there is no row to carry the window count
+            count_result = await self.db.execute(select(func.count(User.id)))
+            total = count_result.scalar() or 0
+        else:
+            total = 0
         
-        # Convert to response models
-        user_responses = [UserResponse.model_validate(user) for user in users]
+        # Convert to response models without re-validating every row
+        user_responses = [user_response_from_row(row) for row in rows]
         
         # Calculate pagination metadata
         total_pages = (total + pagination.page_size - 1) // pagination.page_size if total > 0 else 0
@@ -145,10 +183,7 @@ class UserService:
         logger.info(f"Updating user: {user_id}")
         
         # Get user
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
         
         if not user:
             logger.warning(f"User not found: {user_id}")
@@ -179,10 +214,7 @@ class UserService:
         logger.info(f"Deleting user: {user_id}")
         
         # Get user
-        result = await self.db.execute(
-            select(User).where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
         
         if not user:
             logger.warning(f"User not found: {user_id}")
@@ -13,7 +13,10 @@ import os
 
 from app.main import create_app
 from app.models.user import Base
-from app.core.database import get_db
+from app.config import settings
+from app.core.database import get_db, get_read_db
+from app.schemas.auth import UserCreate
+from app.services.auth_service import AuthService
 
 # Test database URL
 TEST_DATABASE_URL = os.getenv(
@@ -78,6 +81,10 @@ async def db_session(engine) -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
         yield session
         await session.rollback()
+        # Endpoints commit, so clear every table to keep tests independent
+        for table in reversed(Base.metadata.sorted_tables):
+            await session.execute(table.delete())
+        await session.commit()
 
 
 @pytest.fixture
@@ -98,6 +105,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -136,3 +144,60 @@ def test_superuser_data() -> dict:
         "last_name": "User",
         "is_superuser": True
     }
+
+
+async def _login_headers(client: AsyncClient, email: str, password: str) -> dict:
+    """
+    Log in and build the Authorization header.
+    
+    Args:
+        client: Test client
+        email: User email
+        password: User password
+        
+    Returns:
+        Request headers carrying the access token
+    """
+    response = await client.post(
+        f"{settings.API_V1_PREFIX}/login",
+        data={"username": email, "password": password}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def user_headers(client: AsyncClient, test_user_data: dict) -> dict:
+    """
+    Register a regular user and get its auth headers.
+    
+    Args:
+        client: Test client
+        test_user_data: Test user data
+        
+    Returns:
+        Request headers for the regular user
+    """
+    await client.post(f"{settings.API_V1_PREFIX}/register", json=test_user_data)
+    return await _login_headers(client, test_user_data["email"], test_user_data["password"])
+
+
+@pytest.fixture
+async def superuser_headers(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_superuser_data: dict
+) -> dict:
+    """
+    Create a superuser and get its auth headers.
+    
+    Args:
+        client: Test client
+        db_session: Test database session
+        test_superuser_data: Test superuser data
+        
+    Returns:
+        Request headers for the superuser
+    """
+    user_data = UserCreate(**{k: v for k, v in test_superuser_data.items() if k != "is_superuser"})
+    await AuthService(db_session).register_user(user_data, is_superuser=True)
+    return await _login_headers(client, test_superuser_data["email"], test_superuser_data["password"])
@@ -5,8 +5,23 @@ Tests the complete authentication flow including registration,
 login, token refresh, and logout.
 """
 
+import asyncio
+import hashlib
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import auth as auth_api
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.dependencies import get_current_user_claims
+from app.models.user import RefreshToken
+from app.schemas.auth import RefreshTokenRequest, Token
+from app.services.auth_service import AuthService
+
+API_PREFIX = settings.API_V1_PREFIX
 
 
 @pytest.mark.asyncio
@@ -22,7 +37,7 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         response = await client.post(
-            "/api/v1/register",
+            f"{API_PREFIX}/register",
             json=test_user_data
         )
         
@@ -42,11 +57,11 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         # Register first time
-        await client.post("/api/v1/register", json=test_user_data)
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
         
         # Try to register again with same email
         response = await client.post(
-            "/api/v1/register",
+            f"{API_PREFIX}/register",
             json=test_user_data
         )
         
@@ -61,11 +76,11 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         # Register user first
-        await client.post("/api/v1/register", json=test_user_data)
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
         
         # Login
         response = await client.post(
-            "/api/v1/login",
+            f"{API_PREFIX}/login",
             data={
                 "username": test_user_data["email"],
                 "password": test_user_data["password"]
@@ -74,10 +89,9 @@ class TestAuthEndpoints:
         
         assert response.status_code == 200
         data = response.json()
-        assert data["success"] is True
-        assert "access_token" in data["data"]
-        assert "refresh_token" in data["data"]
-        assert data["data"]["token_type"] == "bearer"
+        assert "access_token" in data
+        assert "refresh_token" in data
+        assert data["token_type"] == "bearer"
     
     async def test_login_invalid_credentials(self, client: AsyncClient, test_user_data: dict):
         """
@@ -88,7 +102,7 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         response = await client.post(
-            "/api/v1/login",
+            f"{API_PREFIX}/login",
             data={
                 "username": test_user_data["email"],
                 "password": "wrongpassword"
@@ -106,19 +120,19 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         # Register and login
-        await client.post("/api/v1/register", json=test_user_data)
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
         login_response = await client.post(
-            "/api/v1/login",
+            f"{API_PREFIX}/login",
             data={
                 "username": test_user_data["email"],
                 "password": test_user_data["password"]
             }
         )
-        token = login_response.json()["data"]["access_token"]
+        token = login_response.json()["access_token"]
         
         # Get current user
         response = await client.get(
-            "/api/v1/me",
+            f"{API_PREFIX}/me",
             headers={"Authorization": f"Bearer {token}"}
         )
         
@@ -127,6 +141,127 @@ class TestAuthEndpoints:
         assert data["success"] is True
         assert data["data"]["email"] == test_user_data["email"]
     
+    async def test_get_current_user_from_claims(self, client: AsyncClient, test_user_data: dict):
+        """
+        Test that the claims-only dependency builds the user from the token alone.
+        
+        Args:
+            client: Test client
+            test_user_data: Test user data
+        """
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
+        login_response = await client.post(
+            f"{API_PREFIX}/login",
+            data={
+                "username": test_user_data["email"],
+                "password": test_user_data["password"]
+            }
+        )
+        token = login_response.json()["access_token"]
+        
+        user = await get_current_user_claims(token)
+        
+        assert user.email == test_user_data["email"]
+        assert user.first_name == test_user_data["first_name"]
+        assert user.is_active is True
+        assert user.is_superuser is False
+    
+    async def test_get_current_user_after_admin_update(
+        self,
+        client: AsyncClient,
+        user_headers: dict,
+        superuser_headers: dict
+    ):
+        """
+        Test that an admin change revokes the claims served by /me.
+        
+        Args:
+            client: Test client
+            user_headers: Regular user auth headers
+            superuser_headers: Superuser auth headers
+        """
+        user_id = (await client.get(f"{API_PREFIX}/me", headers=user_headers)).json()["data"]["id"]
+        
+        update_response = await client.put(
+            f"{API_PREFIX}/users/{user_id}",
+            json={"first_name": "Renamed"},
+            headers=superuser_headers
+        )
+        response = await client.get(f"{API_PREFIX}/me", headers=user_headers)
+        
+        assert update_response.status_code == 200
+        assert response.status_code == 401
+    
+    async def test_tokens_issued_right_after_admin_update(
+        self,
+        client: AsyncClient,
+        test_user_data: dict,
+        superuser_headers: dict
+    ):
+        """
+        Test that a login or refresh immediately after an admin change gives working tokens.
+        
+        Args:
+            client: Test client
+            test_user_data: Test user data
+            superuser_headers: Superuser auth headers
+        """
+        credentials = {"username": test_user_data["email"], "password": test_user_data["password"]}
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
+        tokens = (await client.post(f"{API_PREFIX}/login", data=credentials)).json()
+        user_headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        user_id = (await client.get(f"{API_PREFIX}/me", headers=user_headers)).json()["data"]["id"]
+        
+        await client.put(
+            f"{API_PREFIX}/users/{user_id}",
+            json={"first_name": "Renamed"},
+            headers=superuser_headers
+        )
+        refreshed = (await client.post(
+            f"{API_PREFIX}/refresh",
+            json={"refresh_token": tokens["refresh_token"]}
+        )).json()
+        logged_in = (await client.post(f"{API_PREFIX}/login", data=credentials)).json()
+        
+        for access_token in (refreshed["access_token"], logged_in["access_token"]):
+            response = await client.get(
+                f"{API_PREFIX}/me",
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            assert response.status_code == 200
+            assert response.json()["data"]["first_name"] == "Renamed"
+    
+    async def test_admin_update_reports_failed_revocation(
+        self,
+        client: AsyncClient,
+        user_headers: dict,
+        superuser_headers: dict,
+        monkeypatch
+    ):
+        """
+        Test that an admin change whose token revocation fails returns 503.
+        
+        Args:
+            client: Test client
+            user_headers: Regular user auth headers
+            superuser_headers: Superuser auth headers
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        user_id = (await client.get(f"{API_PREFIX}/me", headers=user_headers)).json()["data"]["id"]
+        
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        
+        monkeypatch.setattr(redis_client, "set", unavailable)
+        
+        response = await client.put(
+            f"{API_PREFIX}/users/{user_id}",
+            json={"first_name": "Renamed"},
+            headers=superuser_headers
+        )
+        
+        assert response.status_code == 503
+    
     async def test_refresh_token(self, client: AsyncClient, test_user_data: dict):
         """
         Test token refresh.
@@ -136,26 +271,123 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         # Register and login
-        await client.post("/api/v1/register", json=test_user_data)
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
         login_response = await client.post(
-            "/api/v1/login",
+            f"{API_PREFIX}/login",
             data={
                 "username": test_user_data["email"],
                 "password": test_user_data["password"]
             }
         )
-        refresh_token = login_response.json()["data"]["refresh_token"]
+        refresh_token = login_response.json()["refresh_token"]
         
         # Refresh token
         response = await client.post(
-            "/api/v1/refresh",
+            f"{API_PREFIX}/refresh",
             json={"refresh_token": refresh_token}
         )
         
         assert response.status_code == 200
         data = response.json()
-        assert data["success"] is True
-        assert "access_token" in data["data"]
+        assert "access_token" in data
+        assert data["refresh_token"] != refresh_token
+    
+    async def test_refresh_token_concurrent_duplicates(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user_data: dict
+    ):
+        """
+        Test that concurrent refreshes with one token rotate it only once.
+        
+        Args:
+            client: Test client
+            db_session: Test database session
+            test_user_data: Test user data
+        """
+        # Register and login
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
+        login_response = await client.post(
+            f"{API_PREFIX}/login",
+            data={
+                "username": test_user_data["email"],
+                "password": test_user_data["password"]
+            }
+        )
+        refresh_token = login_response.json()["refresh_token"]
+        
+        # Fire both refreshes at once
+        first, second = await asyncio.gather(
+            client.post(f"{API_PREFIX}/refresh", json={"refresh_token": refresh_token}),
+            client.post(f"{API_PREFIX}/refresh", json={"refresh_token": refresh_token}),
+        )
+        
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.json() == second.json()
+        
+        # One rotation: the login token is revoked and a single new one is live
+        live_tokens = await db_session.scalar(
+            select(func.count()).select_from(RefreshToken).where(RefreshToken.is_revoked.is_(False))
+        )
+        assert live_tokens == 1
+    
+    async def test_refresh_token_duplicate_survives_cancelled_first_request(self, monkeypatch):
+        """
+        Test that a duplicate refresh still completes when the first one is cancelled.
+        
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        calls = []
+        
+        async def fake_refresh_access_token(self, refresh_token: str) -> Token:
+            calls.append(refresh_token)
+            if len(calls) == 1:
+                # First request hangs until its client goes away
+                await asyncio.Event().wait()
+            return Token(access_token="access", refresh_token="refresh", expires_in=60)
+        
+        monkeypatch.setattr(AuthService, "refresh_access_token", fake_refresh_access_token)
+        request_data = RefreshTokenRequest(refresh_token="same-token")
+        
+        first = asyncio.create_task(auth_api.refresh_token(request_data, db=None))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(auth_api.refresh_token(request_data, db=None))
+        await asyncio.sleep(0)
+        first.cancel()
+        
+        response = await second
+        
+        assert response.status_code == 200
+        assert len(calls) == 2
+        with pytest.raises(asyncio.CancelledError):
+            await first
+    
+    async def test_change_password(self, client: AsyncClient, test_user_data: dict, user_headers: dict):
+        """
+        Test password change returns 204 and the new password works.
+        
+        Args:
+            client: Test client
+            test_user_data: Test user data
+            user_headers: Regular user auth headers
+        """
+        response = await client.post(
+            f"{API_PREFIX}/change-password",
+            json={"old_password": test_user_data["password"], "new_password": "Changed123!@#"},
+            headers=user_headers
+        )
+        
+        assert response.status_code == 204
+        assert response.content == b""
+        
+        login_response = await client.post(
+            f"{API_PREFIX}/login",
+            data={"username": test_user_data["email"], "password": "Changed123!@#"}
+        )
+        assert login_response.status_code == 200
     
     async def test_logout(self, client: AsyncClient, test_user_data: dict):
         """
@@ -166,29 +398,76 @@ class TestAuthEndpoints:
             test_user_data: Test user data
         """
         # Register and login
-        await client.post("/api/v1/register", json=test_user_data)
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
         login_response = await client.post(
-            "/api/v1/login",
+            f"{API_PREFIX}/login",
             data={
                 "username": test_user_data["email"],
                 "password": test_user_data["password"]
             }
         )
-        token = login_response.json()["data"]["access_token"]
+        token = login_response.json()["access_token"]
         
         # Logout
         response = await client.post(
-            "/api/v1/logout",
+            f"{API_PREFIX}/logout",
             headers={"Authorization": f"Bearer {token}"}
         )
         
-        assert response.status_code == 200
-        assert response.json()["success"] is True
+        assert response.status_code == 204
+        assert response.content == b""
         
         # Try to use the token after logout
         response = await client.get(
-            "/api/v1/me",
+            f"{API_PREFIX}/me",
             headers={"Authorization": f"Bearer {token}"}
         )
         
         assert response.status_code == 401
+    
+    async def test_forgot_password_throttled_per_email(self, client: AsyncClient, test_user_data: dict):
+        """
+        Test that forgot-password stops issuing tokens past the per-email limit.
+        
+        Args:
+            client: Test client
+            test_user_data: Test user data
+        """
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
+        email_hash = hashlib.sha256(test_user_data["email"].lower().encode()).hexdigest()[:16]
+        await redis_client.delete(f"fpw:{email_hash}")
+        
+        responses = [
+            await client.post(f"{API_PREFIX}/forgot-password", json={"email": test_user_data["email"]})
+            for _ in range(auth_api.FORGOT_PASSWORD_MAX_REQUESTS + 1)
+        ]
+        
+        assert all(response.status_code == 200 for response in responses)
+        assert all(response.json()["data"]["reset_token"] for response in responses[:-1])
+        assert not responses[-1].json().get("data")
+    
+    async def test_forgot_password_fails_open_without_redis(
+        self,
+        client: AsyncClient,
+        test_user_data: dict,
+        monkeypatch
+    ):
+        """
+        Test that a throttle outage does not block password reset requests.
+        
+        Args:
+            client: Test client
+            test_user_data: Test user data
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        await client.post(f"{API_PREFIX}/register", json=test_user_data)
+        
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        
+        monkeypatch.setattr(redis_client, "incr_with_expire", unavailable)
+        
+        response = await client.post(f"{API_PREFIX}/forgot-password", json={"email": test_user_data["email"]})
+        
+        assert response.status_code == 200
+        assert response.json()["data"]["reset_token"]
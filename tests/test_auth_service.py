@@ -6,10 +6,16 @@ Tests authentication business logic in isolation.
 
 import pytest
 from datetime import datetime, timedelta
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.user import RefreshToken
+
+from app.services import auth_service as auth_service_module
 from app.services.auth_service import AuthService
-from app.schemas.auth import UserCreate
+from app.services.role_cache import role_cache
+from app.config import settings
+from app.schemas.auth import ChangePasswordRequest, UserCreate
 from gravity_common.exceptions import UnauthorizedException, ConflictException
 
 
@@ -63,6 +69,31 @@ class TestAuthService:
         with pytest.raises(ConflictException):
             await auth_service.register_user(user_data)
     
+    async def test_register_user_with_stale_default_role(self, db_session: AsyncSession):
+        """
+        Test that a deleted cached default role is re-read instead of reported as a conflict.
+        
+        Args:
+            db_session: Test database session
+        """
+        auth_service = AuthService(db_session)
+        
+        # Cache a role ID that no longer exists for the current roles version
+        version = await role_cache.current_version()
+        auth_service_module._DEFAULT_ROLE_IDS["user"] = (version, 999999)
+        
+        user_data = UserCreate(
+            email="stalerole@example.com",
+            password="Test123!@#",
+            first_name="Stale",
+            last_name="Role"
+        )
+        
+        user = await auth_service.register_user(user_data)
+        
+        assert user.email == user_data.email
+        assert auth_service_module._DEFAULT_ROLE_IDS["user"][1] != 999999
+    
     async def test_authenticate_user_success(self, db_session: AsyncSession):
         """
         Test successful user authentication.
@@ -131,15 +162,16 @@ class TestAuthService:
             first_name="Token",
             last_name="User"
         )
-        user = await auth_service.register_user(user_data)
+        await auth_service.register_user(user_data)
+        user = await auth_service.authenticate_user(user_data.email, user_data.password)
         
         # Create tokens
-        tokens = await auth_service.create_tokens(user.id, user.email)
+        tokens = await auth_service.create_tokens(user)
         
-        assert "access_token" in tokens
-        assert "refresh_token" in tokens
-        assert tokens["token_type"] == "bearer"
-        assert tokens["expires_in"] == 3600  # 1 hour default
+        assert tokens.access_token
+        assert tokens.refresh_token
+        assert tokens.token_type == "bearer"
+        assert tokens.expires_in == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
     async def test_change_password(self, db_session: AsyncSession):
         """
@@ -162,8 +194,10 @@ class TestAuthService:
         # Change password
         await auth_service.change_password(
             user.id,
-            "OldPassword123!@#",
-            "NewPassword123!@#"
+            ChangePasswordRequest(
+                old_password="OldPassword123!@#",
+                new_password="NewPassword123!@#"
+            )
         )
         
         # Try to authenticate with old password (should fail)
@@ -180,3 +214,111 @@ class TestAuthService:
         )
         
         assert authenticated_user.email == user_data.email
+    
+    async def _login(self, auth_service: AuthService, email: str):
+        """
+        Register a user and issue its first token pair.
+        
+        Args:
+            auth_service: Auth service under test
+            email: User email
+            
+        Returns:
+            Tuple of (user, tokens)
+        """
+        user_data = UserCreate(
+            email=email,
+            password="Test123!@#",
+            first_name="Refresh",
+            last_name="User"
+        )
+        await auth_service.register_user(user_data)
+        user = await auth_service.authenticate_user(user_data.email, user_data.password)
+        return user, await auth_service.create_tokens(user)
+    
+    async def _refresh_token_count(self, db_session: AsyncSession, user_id: int) -> int:
+        """
+        Count refresh tokens stored for a user.
+        
+        Args:
+            db_session: Test database session
+            user_id: User ID
+            
+        Returns:
+            Number of refresh token rows
+        """
+        return await db_session.scalar(
+            select(func.count()).select_from(RefreshToken).where(RefreshToken.user_id == user_id)
+        )
+    
+    async def test_refresh_rotates_token(self, db_session: AsyncSession):
+        """
+        Test that a rotated refresh token cannot be used again.
+        
+        Args:
+            db_session: Test database session
+        """
+        auth_service = AuthService(db_session)
+        user, tokens = await self._login(auth_service, "rotate@example.com")
+        
+        new_tokens = await auth_service.refresh_access_token(tokens.refresh_token)
+        
+        assert new_tokens.refresh_token != tokens.refresh_token
+        with pytest.raises(UnauthorizedException):
+            await auth_service.refresh_access_token(tokens.refresh_token)
+        
+        # The new token still works
+        assert await auth_service.refresh_access_token(new_tokens.refresh_token)
+    
+    async def test_refresh_rejects_expired_token(self, db_session: AsyncSession):
+        """
+        Test that an expired refresh token issues no new tokens.
+        
+        Args:
+            db_session: Test database session
+        """
+        auth_service = AuthService(db_session)
+        user, tokens = await self._login(auth_service, "expired@example.com")
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user.id)
+            .values(expires_at=datetime.utcnow() - timedelta(minutes=1))
+        )
+        await db_session.commit()
+        
+        with pytest.raises(UnauthorizedException):
+            await auth_service.refresh_access_token(tokens.refresh_token)
+        
+        assert await self._refresh_token_count(db_session, user.id) == 1
+    
+    async def test_refresh_rejects_revoked_token(self, db_session: AsyncSession):
+        """
+        Test that a revoked refresh token issues no new tokens.
+        
+        Args:
+            db_session: Test database session
+        """
+        auth_service = AuthService(db_session)
+        user, tokens = await self._login(auth_service, "revoked@example.com")
+        await db_session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user.id)
+            .values(is_revoked=True)
+        )
+        await db_session.commit()
+        
+        with pytest.raises(UnauthorizedException):
+            await auth_service.refresh_access_token(tokens.refresh_token)
+        
+        assert await self._refresh_token_count(db_session, user.id) == 1
+    
+    async def test_is_token_blacklisted_invalid_token(self, db_session: AsyncSession):
+        """
+        Test that a token failing verification is reported as blacklisted.
+        
+        Args:
+            db_session: Test database session
+        """
+        auth_service = AuthService(db_session)
+        
+        assert await auth_service.is_token_blacklisted("not-a-jwt") is True
@@ -0,0 +1,50 @@
+"""
+Unit tests for queued logging.
+
+Tests that records reach the original handlers and that stopping the
+listeners restores them.
+"""
+
+import logging
+
+from app.core.log_queue import start_queue_logging
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler that keeps the records it receives."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+class TestQueueLogging:
+    """Test suite for start_queue_logging."""
+    
+    def test_records_are_copied_and_handlers_restored(self):
+        """Test that the caller's record is untouched and handlers come back on stop."""
+        target = logging.getLogger("tests.log_queue")
+        target.propagate = False
+        handler = _CollectingHandler()
+        target.addHandler(handler)
+        
+        listeners = start_queue_logging(target)
+        assert handler not in target.handlers
+        
+        record = target.makeRecord(target.name, logging.INFO, __file__, 1, "value: %s", (42,), None)
+        target.handle(record)
+        
+        for listener in listeners:
+            listener.stop()
+        
+        assert record.args == (42,)
+        assert handler.records[0].getMessage() == "value: 42"
+        assert target.handlers == [handler]
+        
+        # Records logged after shutdown are written directly
+        target.info("after stop")
+        assert handler.records[-1].getMessage() == "after stop"
+        target.removeHandler(handler)
@@ -0,0 +1,297 @@
+"""
+Integration tests for role endpoints.
+
+Tests the cached role list (L1/L2 cache, ETag and 304 revalidation) and
+bulk role assignment.
+"""
+
+from datetime import datetime
+from typing import List
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import roles as roles_api
+from app.config import settings
+from app.core.redis_client import redis_client
+from app.models.user import User
+from app.schemas.auth import RoleResponse
+from app.services.role_cache import role_cache
+
+API_PREFIX = settings.API_V1_PREFIX
+
+
+@pytest.fixture
+async def role_loads(monkeypatch) -> List[int]:
+    """
+    Count database loads of the role list, starting from an empty cache.
+    
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        
+    Returns:
+        List that receives one entry per load
+    """
+    loads: List[int] = []
+    
+    async def load_roles() -> List[RoleResponse]:
+        loads.append(1)
+        return [RoleResponse(id=1, name="user", permissions=[], created_at=datetime(2024, 1, 1))]
+    
+    monkeypatch.setattr(roles_api, "_load_roles", load_roles)
+    # A new version starts both cache tiers empty
+    await role_cache.invalidate()
+    return loads
+
+
+@pytest.mark.asyncio
+class TestRoleEndpoints:
+    """Test suite for role endpoints."""
+    
+    async def test_list_roles_miss_then_hit(self, client: AsyncClient, role_loads: List[int]):
+        """
+        Test that the first request loads the roles and the next is served from cache.
+        
+        Args:
+            client: Test client
+            role_loads: Role list load counter
+        """
+        first = await client.get(f"{API_PREFIX}/roles")
+        second = await client.get(f"{API_PREFIX}/roles")
+        
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert first.json()["data"][0]["name"] == "user"
+        assert second.content == first.content
+        assert first.headers["etag"] == second.headers["etag"]
+        assert len(role_loads) == 1
+    
+    async def test_list_roles_not_modified(self, client: AsyncClient, role_loads: List[int]):
+        """
+        Test that a current If-None-Match gets 304 without a body.
+        
+        Args:
+            client: Test client
+            role_loads: Role list load counter
+        """
+        etag = (await client.get(f"{API_PREFIX}/roles")).headers["etag"]
+        
+        response = await client.get(f"{API_PREFIX}/roles", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    async def test_create_role_invalidates_list(
+        self,
+        client: AsyncClient,
+        superuser_headers: dict,
+        role_loads: List[int]
+    ):
+        """
+        Test that creating a role changes the ETag and reloads the list.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+            role_loads: Role list load counter
+        """
+        etag = (await client.get(f"{API_PREFIX}/roles")).headers["etag"]
+        
+        created = await client.post(
+            f"{API_PREFIX}/roles",
+            json={"name": "auditor", "permissions": ["users:read"]},
+            headers=superuser_headers
+        )
+        response = await client.get(f"{API_PREFIX}/roles", headers={"If-None-Match": etag})
+        
+        assert created.status_code == 201
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert len(role_loads) == 2
+    
+    async def test_create_role_without_redis(
+        self,
+        client: AsyncClient,
+        superuser_headers: dict,
+        role_loads: List[int],
+        monkeypatch
+    ):
+        """
+        Test that a committed role is reported as created when invalidation fails.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+            role_loads: Role list load counter
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        await client.get(f"{API_PREFIX}/roles")
+        
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        
+        monkeypatch.setattr(redis_client, "incr", unavailable)
+        
+        response = await client.post(
+            f"{API_PREFIX}/roles",
+            json={"name": "auditor", "permissions": ["users:read"]},
+            headers=superuser_headers
+        )
+        
+        assert response.status_code == 201
+        # This worker dropped its copy before the failed version bump
+        assert role_cache._payload is None
+    
+    async def test_list_roles_without_redis(
+        self,
+        client: AsyncClient,
+        role_loads: List[int],
+        monkeypatch
+    ):
+        """
+        Test that roles are served from the database, without an ETag, when Redis is down.
+        
+        Args:
+            client: Test client
+            role_loads: Role list load counter
+            monkeypatch: Pytest monkeypatch fixture
+        """
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        
+        monkeypatch.setattr(redis_client, "get", unavailable)
+        monkeypatch.setattr(role_cache, "_version", None)
+        
+        response = await client.get(f"{API_PREFIX}/roles")
+        
+        assert response.status_code == 200
+        assert response.json()["data"][0]["name"] == "user"
+        assert "etag" not in response.headers
+        assert len(role_loads) == 1
+    
+    async def _create_role_and_get_user_id(
+        self,
+        client: AsyncClient,
+        superuser_headers: dict,
+        user_headers: dict
+    ) -> tuple:
+        """
+        Create a role and look up the regular user's ID.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+            user_headers: Regular user auth headers
+            
+        Returns:
+            Tuple of (role_id, user_id)
+        """
+        role = await client.post(
+            f"{API_PREFIX}/roles",
+            json={"name": "editor", "permissions": ["posts:write"]},
+            headers=superuser_headers
+        )
+        user = await client.get(f"{API_PREFIX}/me", headers=user_headers)
+        return role.json()["data"]["id"], user.json()["data"]["id"]
+    
+    async def test_bulk_assign_roles(
+        self,
+        client: AsyncClient,
+        superuser_headers: dict,
+        user_headers: dict
+    ):
+        """
+        Test bulk role assignment for existing users and roles.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+            user_headers: Regular user auth headers
+        """
+        role_id, user_id = await self._create_role_and_get_user_id(client, superuser_headers, user_headers)
+        
+        response = await client.post(
+            f"{API_PREFIX}/users/roles/bulk-assign",
+            json={"assignments": [{"user_id": user_id, "role_id": role_id}]},
+            headers=superuser_headers
+        )
+        
+        assert response.status_code == 200
+        assert response.json()["data"]["updated"] == 1
+    
+    async def test_bulk_assign_roles_missing_user(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        superuser_headers: dict,
+        user_headers: dict
+    ):
+        """
+        Test that a batch with an unknown user is rejected as a whole.
+        
+        Args:
+            client: Test client
+            db_session: Test database session
+            superuser_headers: Superuser auth headers
+            user_headers: Regular user auth headers
+        """
+        role_id, user_id = await self._create_role_and_get_user_id(client, superuser_headers, user_headers)
+        
+        response = await client.post(
+            f"{API_PREFIX}/users/roles/bulk-assign",
+            json={"assignments": [
+                {"user_id": user_id, "role_id": role_id},
+                {"user_id": 999999, "role_id": role_id},
+            ]},
+            headers=superuser_headers
+        )
+        assigned_role_id = await db_session.scalar(select(User.role_id).where(User.id == user_id))
+        
+        assert response.status_code == 404
+        assert assigned_role_id != role_id
+    
+    async def test_bulk_assign_roles_missing_role(
+        self,
+        client: AsyncClient,
+        superuser_headers: dict,
+        user_headers: dict
+    ):
+        """
+        Test that a batch with an unknown role is rejected as a whole.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+            user_headers: Regular user auth headers
+        """
+        role_id, user_id = await self._create_role_and_get_user_id(client, superuser_headers, user_headers)
+        
+        response = await client.post(
+            f"{API_PREFIX}/users/roles/bulk-assign",
+            json={"assignments": [
+                {"user_id": user_id, "role_id": role_id},
+                {"user_id": user_id, "role_id": 999999},
+            ]},
+            headers=superuser_headers
+        )
+        
+        assert response.status_code == 404
+    
+    async def test_bulk_assign_roles_requires_superuser(self, client: AsyncClient, user_headers: dict):
+        """
+        Test that regular users cannot bulk assign roles.
+        
+        Args:
+            client: Test client
+            user_headers: Regular user auth headers
+        """
+        response = await client.post(
+            f"{API_PREFIX}/users/roles/bulk-assign",
+            json={"assignments": [{"user_id": 1, "role_id": 1}]},
+            headers=user_headers
+        )
+        
+        assert response.status_code == 403
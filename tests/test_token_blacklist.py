@@ -0,0 +1,89 @@
+"""
+Unit tests for TokenBlacklist.
+
+Tests revocation lookups against Redis, the in-process negative cache, and
+keys written before the switch to jti-based keys.
+"""
+
+import asyncio
+import secrets
+import time
+
+import pytest
+
+from app.core.redis_client import redis_client
+from app.core.security import legacy_blacklist_key
+from app.core.token_blacklist import TokenBlacklist
+
+
+@pytest.mark.asyncio
+class TestTokenBlacklist:
+    """Test suite for TokenBlacklist."""
+    
+    async def test_legacy_key_is_checked_within_window(self):
+        """Test that a token revoked under the legacy key stays revoked."""
+        blacklist = TokenBlacklist(local_ttl=5.0, local_max_entries=10, token_lifetime=60, legacy_window=60.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12)}
+        await redis_client.set(legacy_blacklist_key(token), "1", expire=60)
+        
+        assert await blacklist.is_blacklisted(payload, token) is True
+    
+    async def test_legacy_key_is_ignored_after_window(self):
+        """Test that legacy keys are no longer checked once the window has passed."""
+        blacklist = TokenBlacklist(local_ttl=5.0, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12)}
+        await redis_client.set(legacy_blacklist_key(token), "1", expire=60)
+        
+        assert await blacklist.is_blacklisted(payload, token) is False
+    
+    async def test_negative_lookup_is_cached_locally(self, monkeypatch):
+        """Test that a "not blacklisted" answer is reused without Redis."""
+        blacklist = TokenBlacklist(local_ttl=5.0, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12), "sub": "1", "exp": int(time.time()) + 60}
+        
+        assert await blacklist.is_blacklisted(payload, token) is False
+        
+        async def unavailable(*args, **kwargs):
+            raise ConnectionError("Redis unavailable")
+        
+        monkeypatch.setattr(redis_client, "mget", unavailable)
+        assert await blacklist.is_blacklisted(payload, token) is False
+    
+    async def test_logout_evicts_local_entry(self):
+        """Test that blacklisting in this worker takes effect immediately."""
+        blacklist = TokenBlacklist(local_ttl=5.0, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12), "sub": "1", "exp": int(time.time()) + 60}
+        
+        assert await blacklist.is_blacklisted(payload, token) is False
+        await blacklist.add(payload, token, ttl=60)
+        
+        assert await blacklist.is_blacklisted(payload, token) is True
+    
+    async def test_other_worker_sees_logout_after_window(self):
+        """Test that another worker's cached answer lasts at most the propagation window."""
+        this_worker = TokenBlacklist(local_ttl=0.05, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        other_worker = TokenBlacklist(local_ttl=0.05, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12), "sub": "1", "exp": int(time.time()) + 60}
+        
+        assert await other_worker.is_blacklisted(payload, token) is False
+        await this_worker.add(payload, token, ttl=60)
+        await asyncio.sleep(0.06)
+        
+        assert await other_worker.is_blacklisted(payload, token) is True
+    
+    async def test_zero_window_disables_local_cache(self):
+        """Test that a propagation window of 0 checks Redis on every lookup."""
+        this_worker = TokenBlacklist(local_ttl=0.0, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        other_worker = TokenBlacklist(local_ttl=0.0, local_max_entries=10, token_lifetime=60, legacy_window=0.0)
+        token = secrets.token_urlsafe(32)
+        payload = {"jti": secrets.token_urlsafe(12), "sub": "1", "exp": int(time.time()) + 60}
+        
+        assert await other_worker.is_blacklisted(payload, token) is False
+        await this_worker.add(payload, token, ttl=60)
+        
+        assert await other_worker.is_blacklisted(payload, token) is True
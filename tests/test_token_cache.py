@@ -0,0 +1,73 @@
+"""
+Unit tests for TokenCache.
+
+Tests that cache invalidation degrades gracefully when Redis fails.
+"""
+
+import time
+
+import pytest
+
+from app.core.redis_client import redis_client
+from app.core.token_cache import TokenCache
+from app.schemas.auth import UserResponse
+
+
+async def _unavailable(*args, **kwargs):
+    raise ConnectionError("Redis unavailable")
+
+
+def _pipeline_unavailable(*args, **kwargs):
+    raise ConnectionError("Redis unavailable")
+
+
+@pytest.fixture
+def cached_user() -> UserResponse:
+    """
+    Get a user as resolved from an access token.
+    
+    Returns:
+        User data
+    """
+    return UserResponse.model_construct(id=42, email="cached@example.com")
+
+
+@pytest.mark.asyncio
+class TestTokenCache:
+    """Test suite for TokenCache."""
+    
+    async def test_invalidate_user_survives_redis_failure(self, monkeypatch, cached_user: UserResponse):
+        """
+        Test that invalidate_user drops local entries and does not raise on Redis errors.
+        
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+            cached_user: Cached user data
+        """
+        cache = TokenCache(max_ttl=60, local_ttl=60, local_max_entries=10)
+        monkeypatch.setattr(redis_client, "pipeline", _pipeline_unavailable)
+        monkeypatch.setattr(redis_client, "smembers", _unavailable)
+        
+        await cache.set("token", cached_user, int(time.time()) + 60)
+        await cache.invalidate_user(cached_user.id)
+        
+        monkeypatch.setattr(redis_client, "get", _unavailable)
+        assert await cache.get("token") is None
+    
+    async def test_delete_survives_redis_failure(self, monkeypatch, cached_user: UserResponse):
+        """
+        Test that delete drops the local entry and does not raise on Redis errors.
+        
+        Args:
+            monkeypatch: Pytest monkeypatch fixture
+            cached_user: Cached user data
+        """
+        cache = TokenCache(max_ttl=60, local_ttl=60, local_max_entries=10)
+        monkeypatch.setattr(redis_client, "pipeline", _pipeline_unavailable)
+        monkeypatch.setattr(redis_client, "delete", _unavailable)
+        
+        await cache.set("token", cached_user, int(time.time()) + 60)
+        await cache.delete("token")
+        
+        monkeypatch.setattr(redis_client, "get", _unavailable)
+        assert await cache.get("token") is None
@@ -0,0 +1,60 @@
+"""
+Integration tests for user management endpoints.
+
+Tests the ordering of the superuser and self-deletion checks on delete.
+"""
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+
+API_PREFIX = settings.API_V1_PREFIX
+
+
+async def _own_user_id(client: AsyncClient, headers: dict) -> int:
+    """
+    Get the caller's user ID.
+    
+    Args:
+        client: Test client
+        headers: Caller's auth headers
+        
+    Returns:
+        User ID of the caller
+    """
+    response = await client.get(f"{API_PREFIX}/me", headers=headers)
+    return response.json()["data"]["id"]
+
+
+@pytest.mark.asyncio
+class TestUserEndpoints:
+    """Test suite for user management endpoints."""
+    
+    async def test_delete_self_as_regular_user(self, client: AsyncClient, user_headers: dict):
+        """
+        Test that a regular user targeting their own ID gets 403, not 400.
+        
+        Args:
+            client: Test client
+            user_headers: Regular user auth headers
+        """
+        user_id = await _own_user_id(client, user_headers)
+        
+        response = await client.delete(f"{API_PREFIX}/users/{user_id}", headers=user_headers)
+        
+        assert response.status_code == 403
+    
+    async def test_delete_self_as_superuser(self, client: AsyncClient, superuser_headers: dict):
+        """
+        Test that a superuser cannot delete their own account.
+        
+        Args:
+            client: Test client
+            superuser_headers: Superuser auth headers
+        """
+        user_id = await _own_user_id(client, superuser_headers)
+        
+        response = await client.delete(f"{API_PREFIX}/users/{user_id}", headers=superuser_headers)
+        
+        assert response.status_code == 400